@@ -0,0 +1,4 @@
+'''
+Molecular Clock
+    Find regulatory motifs scattered across the upstream regions of genes.
+'''
@@ -0,0 +1,4 @@
+'''
+Replication Origin
+    Find the origin of replication (ori) in bacterial genomes using skew diagrams and frequent/clumped kmers.
+'''
@@ -1,6 +1,11 @@
 # Hamming Distance = the number of positions at which the corresponding chars are different between two strings of equal length
-from collections import defaultdict
-from reverse_complement import reverse_complement
+from collections import defaultdict, deque
+from itertools import combinations, product
+from .kmer_codec import decode_kmers
+from .reverse_complement import reverse_complement
+
+# Largest k whose counts approx_clump_finder keeps in a list of all 4**k kmers (32 MB); larger k use a dict
+LIST_MAX_K = 11
 
 def hamming_distance(string1, string2):
     '''
@@ -129,6 +134,107 @@ def most_frequent_approx_pattern(text, k, d):
             kmers.append(pattern)
     return kmers
 
+def neighbor_offsets(k, d):
+    '''
+    Find the XOR masks that turn the number (see pattern_to_number) of any kmer into the numbers of
+    all patterns at most d Hamming distance from it: changing the symbol at a position is an XOR
+    of that position's two bits, so the masks are the same for every kmer.
+
+    INPUT:
+        k(int): the length of the pattern
+        d(int): the max difference from the given pattern
+
+    OUTPUT:
+        offsets(tuple): masks, the first one 0 (the pattern itself)
+    '''
+    offsets = [0]
+    for n_mismatches in range(1, min(d, k) + 1):
+        for positions in combinations(range(k), n_mismatches):
+            for changes in product((1, 2, 3), repeat = n_mismatches):
+                offset = 0
+                for position, change in zip(positions, changes):
+                    offset |= change << (2 * position)
+                offsets.append(offset)
+    return tuple(offsets)
+
+def approx_clump_finder(genome, k, L, t, d, reverse = True):
+    '''
+    Find kmers that form approximate (L,t)-clumps in the genome.
+    Meaning, kmers that appear at least t times with up to d mismatches within a substring of length L,
+    counting the same way as approx_frequency_map (optionally including reverse complements)
+
+    Slides the window along the genome: the d-neighborhood of the kmer entering the window is added
+    to the counts and the d-neighborhood of the kmer leaving is removed, so each window costs
+    two neighborhoods instead of a full recount. Each neighborhood is the kmer's number XORed with
+    the neighbor_offsets(k, d) masks, which are computed once per call.
+    Kmers containing a symbol other than A, C, G, T are ignored.
+
+    INPUT:
+        genome(str): the genome to be analyzed
+        k(int): the length of patterns to find within genome
+        L(int): the length of the substring that encompasses a clump
+        t(int): the number of approximate occurrences a kmer needs within substring
+        d(int): the number of mismatches two strings can have to still count as the same pattern
+        reverse(bool): True = also count the neighborhoods of reverse complements
+    
+    OUTPUT:
+        kmers(set): a set of kmers that form approximate clumps within genome
+    '''
+    symbols = {"A": 0, "C": 1, "G": 2, "T": 3}
+    mask = 4**k - 1
+    top_shift = 2 * (k - 1)
+    # Only kmers near the window's kmers have a count, so for large k a dict is much smaller than 4**k slots
+    sparse = k > LIST_MAX_K
+    counts = defaultdict(lambda: 0) if sparse else [0] * (4**k)
+    clumps = set()
+    # numbers of the forward and reverse complement kmers currently in the window, None if invalid
+    window = deque()
+    window_size = min(L, len(genome)) - k + 1
+    if window_size <= 0:
+        return set()
+    offsets = neighbor_offsets(k, d)
+    code = 0
+    reverse_code = 0
+    valid = 0
+    for i, char in enumerate(genome):
+        symbol = symbols.get(char)
+        if symbol is None:
+            valid = 0
+        else:
+            code = ((code << 2) | symbol) & mask
+            reverse_code = (reverse_code >> 2) | ((3 - symbol) << top_shift)
+            valid += 1
+        # Wait until the first kmer (ending at index k-1) is complete
+        if i < k - 1:
+            continue
+        if len(window) == window_size:
+            leaving = window.popleft()
+            if leaving is not None:
+                for number in (leaving if reverse else leaving[:1]):
+                    for offset in offsets:
+                        counts[number ^ offset] -= 1
+                    if sparse:
+                        # The dict only keeps kmers with a nonzero count, so it stays the size of the window's neighborhoods
+                        for offset in offsets:
+                            if not counts[number ^ offset]:
+                                del counts[number ^ offset]
+        if valid < k:
+            window.append(None)
+            continue
+        window.append((code, reverse_code))
+        for offset in offsets:
+            neighbor = code ^ offset
+            counts[neighbor] += 1
+            if counts[neighbor] >= t:
+                clumps.add(neighbor)
+        if reverse:
+            for offset in offsets:
+                neighbor = reverse_code ^ offset
+                counts[neighbor] += 1
+                if counts[neighbor] >= t:
+                    clumps.add(neighbor)
+    return set(decode_kmers(sorted(clumps), k))
+
 if __name__ == "__main__":
     text = "TCCTTTCCTCCCACTTTCCTCCCACTTTCCTCCACTCCTCCGCGTTTCCTCCTTTCTCCTCTCCTCCCACCACGCGTCTCCTTTCGCGGCGTCCGCGTCCTTGCGGCGCACTCCTTGCGTTTCCCACCACTTGCGTCCTCCTCCCACTCCTCCTCCTCCGCGCACTTCACGCGGCGTTTCCTTGCGTCCTCCACGCGGCGTTTCCGCGTCCACTCCCACTCCGCGCACTCTCCAC"
     k = 5
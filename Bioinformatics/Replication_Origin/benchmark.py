@@ -0,0 +1,241 @@
+'''
+Replication Origin benchmark suite
+    Times and records the peak memory of every public function in pattern_count_frequency,
+    skew_diagram and approximate_patterns (and the bulk kmer_codec) on seeded synthetic genomes from 10 kb to 10 Mb,
+    reports how each function scales with genome size and writes the results to a JSON file
+    that can be compared against a previous run to catch regressions.
+    Each timing is the best of several samples of at least 0.2 s, like timeit.
+
+    python -m Bioinformatics.Replication_Origin.benchmark --output bench.json
+    python -m Bioinformatics.Replication_Origin.benchmark --compare bench.json --output new.json
+'''
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+
+from . import approximate_patterns
+from . import kmer_codec
+from . import pattern_count_frequency
+from . import skew_diagram
+
+SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+K = 9
+L = 500
+T = 3
+D = 1
+PATTERN = "ATGATCAAG"
+# Timing samples per measurement; the best one is kept, since slower samples only add noise from other processes
+REPEAT = 3
+# Changes smaller than this many seconds are never reported as regressions
+MIN_DELTA = 0.005
+
+def synthetic_genome(n, seed = 0):
+    '''
+    Generates a random genome of uniformly distributed nucleotides.
+    The same n and seed always produce the same genome.
+
+    INPUT:
+        n(int): length of the genome
+        seed(int): seed for the random number generator
+    
+    OUTPUT:
+        (str): genome of length n
+    '''
+    rng = random.Random(seed)
+    return "".join(rng.choices("ACGT", k = n))
+
+def kmers(genome, k = K):
+    for i in range(len(genome) - k + 1):
+        yield genome[i:i+k]
+
+# Each case is (module, function name, call, largest genome size to run it on).
+# The cap keeps the quadratic and neighborhood-heavy functions from running for hours.
+CASES = [
+    (pattern_count_frequency, "pattern_count", lambda g: pattern_count_frequency.pattern_count(g, PATTERN), None),
+    (pattern_count_frequency, "frequency_map", lambda g: pattern_count_frequency.frequency_map(g, K), None),
+    (pattern_count_frequency, "most_frequent_pattern", lambda g: pattern_count_frequency.most_frequent_pattern(g, K), None),
+    (pattern_count_frequency, "pattern_matching", lambda g: pattern_count_frequency.pattern_matching(g, PATTERN), None),
+    (pattern_count_frequency, "symbol_to_number", lambda g: [pattern_count_frequency.symbol_to_number(c) for c in g], None),
+    (pattern_count_frequency, "pattern_to_number", lambda g: [pattern_count_frequency.pattern_to_number(p) for p in kmers(g)], 1_000_000),
+    (pattern_count_frequency, "number_to_symbol", lambda g: [pattern_count_frequency.number_to_symbol(i % 4) for i in range(len(g))], None),
+    (pattern_count_frequency, "number_to_pattern", lambda g: [pattern_count_frequency.number_to_pattern(i % 4**K, K) for i in range(len(g))], 1_000_000),
+    (pattern_count_frequency, "computing_frequencies", lambda g: pattern_count_frequency.computing_frequencies(g, K), 1_000_000),
+    (pattern_count_frequency, "canonical_frequency_map", lambda g: pattern_count_frequency.canonical_frequency_map(g, K), None),
+    (pattern_count_frequency, "canonical_computing_frequencies", lambda g: pattern_count_frequency.canonical_computing_frequencies(g, K, True), None),
+    (pattern_count_frequency, "pattern_clump_finder", lambda g: pattern_count_frequency.pattern_clump_finder(g, K, L, T), None),
+    (skew_diagram, "symbol_array", lambda g: skew_diagram.symbol_array(g, "C"), 10_000),
+    (skew_diagram, "faster_symbol_array", lambda g: skew_diagram.faster_symbol_array(g, "C"), None),
+    (skew_diagram, "skew_array", lambda g: skew_diagram.skew_array(g), None),
+    (skew_diagram, "minimum_skew", lambda g: skew_diagram.minimum_skew(g), None),
+    (approximate_patterns, "hamming_distance", lambda g: approximate_patterns.hamming_distance(g, g[::-1]), None),
+    (approximate_patterns, "approx_pattern_matching", lambda g: approximate_patterns.approx_pattern_matching(g, PATTERN, D), 1_000_000),
+    (approximate_patterns, "approx_pattern_count", lambda g: approximate_patterns.approx_pattern_count(g, PATTERN, D), 1_000_000),
+    (approximate_patterns, "pattern_neightbors", lambda g: [approximate_patterns.pattern_neightbors(p, D) for p in kmers(g)], 100_000),
+    (approximate_patterns, "approx_frequency_map", lambda g: approximate_patterns.approx_frequency_map(g, K, D), 100_000),
+    (approximate_patterns, "most_frequent_approx_pattern", lambda g: approximate_patterns.most_frequent_approx_pattern(g, K, D), 100_000),
+    (approximate_patterns, "approx_clump_finder", lambda g: approximate_patterns.approx_clump_finder(g, K, L, T, D), 1_000_000),
+    (kmer_codec, "encode_kmers", lambda g: kmer_codec.encode_kmers(kmers(g)), None),
+    (kmer_codec, "encode_text", lambda g: kmer_codec.encode_text(g, K), None),
+    (kmer_codec, "decode_kmers", lambda g: kmer_codec.decode_kmers([i % 4**K for i in range(len(g))], K), None),
+]
+
+def measure(call, genome, memory = True, repeat = REPEAT):
+    '''
+    Times call(genome) like timeit: each sample loops the call enough times to take at least 0.2 s,
+    and the best of repeat samples is kept. Then runs it once more under tracemalloc for peak memory
+
+    OUTPUT:
+        (dict): seconds per call, loops per sample, repeat and peak_bytes (None if memory is False)
+    '''
+    timer = timeit.Timer(lambda: call(genome))
+    loops, first = timer.autorange()
+    samples = [first] + timer.repeat(repeat - 1, loops)
+    seconds = min(samples) / loops
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            call(genome)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {"seconds": seconds, "loops": loops, "repeat": repeat, "peak_bytes": peak}
+
+def scaling_exponent(points):
+    '''
+    Least squares slope of log(seconds) against log(size), i.e. b in seconds ~ size**b
+
+    INPUT:
+        points(lst): list of (size, seconds) tuples
+    
+    OUTPUT:
+        (float): the fitted exponent, or None if there are fewer than two points
+    '''
+    points = [(math.log(n), math.log(s)) for n, s in points if s > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+def run(sizes = SIZES, seed = 0, memory = True, only = None, max_size = None, repeat = REPEAT, log = sys.stderr):
+    '''
+    Runs every benchmark case on a synthetic genome of each size
+
+    INPUT:
+        sizes(lst): genome lengths to benchmark
+        seed(int): seed for the synthetic genomes
+        memory(bool): True = also record peak memory with tracemalloc
+        only(lst): if given, only run functions with these names
+        max_size(int): if given, overrides every case's size cap
+        repeat(int): timing samples per measurement, the best is kept
+        log(file): where to print progress, None for silence
+    
+    OUTPUT:
+        results(dict): run metadata and, for each function, its measurements and scaling exponent
+    '''
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "parameters": {"k": K, "L": L, "t": T, "d": D, "pattern": PATTERN},
+        "functions": {},
+    }
+    for n in sorted(sizes):
+        genome = synthetic_genome(n, seed)
+        for module, name, call, cap in CASES:
+            if only and name not in only:
+                continue
+            cap = max_size if max_size is not None else cap
+            key = module.__name__.rsplit(".", 1)[-1] + "." + name
+            entry = results["functions"].setdefault(key, {"runs": {}, "skipped": []})
+            if cap is not None and n > cap:
+                entry["skipped"].append(n)
+                continue
+            entry["runs"][str(n)] = measure(call, genome, memory, repeat)
+            if log:
+                run_result = entry["runs"][str(n)]
+                peak = "" if run_result["peak_bytes"] is None else " {:>12,} B".format(run_result["peak_bytes"])
+                print("{:<50} {:>10,} {:>10.4f} s{}".format(key, n, run_result["seconds"], peak), file = log)
+    for entry in results["functions"].values():
+        entry["scaling_exponent"] = scaling_exponent([(int(n), r["seconds"]) for n, r in entry["runs"].items()])
+    return results
+
+def compare(previous, current, threshold = 1.25, min_delta = MIN_DELTA):
+    '''
+    Finds measurements that got slower (or used more memory) by more than threshold times.
+    A slowdown also has to be more than min_delta seconds, so jitter in very fast cases is ignored
+
+    INPUT:
+        previous(dict): results of an earlier run
+        current(dict): results of this run
+        threshold(float): ratio above which a change counts as a regression
+        min_delta(float): smallest slowdown in seconds that counts as a regression
+    
+    OUTPUT:
+        regressions(lst): list of (function, size, metric, old value, new value) tuples
+    '''
+    regressions = []
+    for key, entry in current["functions"].items():
+        old_entry = previous.get("functions", {}).get(key)
+        if old_entry is None:
+            continue
+        for n, result in entry["runs"].items():
+            old_result = old_entry["runs"].get(n)
+            if old_result is None:
+                continue
+            for metric in ("seconds", "peak_bytes"):
+                old, new = old_result.get(metric), result.get(metric)
+                if metric == "seconds" and old and new and new - old <= min_delta:
+                    continue
+                if old and new and new / old > threshold:
+                    regressions.append((key, int(n), metric, old, new))
+    return regressions
+
+def print_report(results, out = sys.stdout):
+    print("{:<50} {:>10} {:>12}".format("function", "exponent", "largest n"), file = out)
+    for key, entry in results["functions"].items():
+        exponent = entry["scaling_exponent"]
+        largest = max((int(n) for n in entry["runs"]), default = 0)
+        print("{:<50} {:>10} {:>12,}".format(key, "-" if exponent is None else "{:.2f}".format(exponent), largest), file = out)
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmark the Replication_Origin functions")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = SIZES, help = "genome lengths to benchmark")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--only", nargs = "+", help = "only benchmark these function names")
+    parser.add_argument("--max-size", type = int, help = "override the per-function size caps")
+    parser.add_argument("--no-memory", action = "store_true", help = "skip the tracemalloc peak memory runs")
+    parser.add_argument("--output", help = "write results as JSON to this file")
+    parser.add_argument("--compare", help = "JSON results of a previous run to check for regressions")
+    parser.add_argument("--threshold", type = float, default = 1.25, help = "slowdown ratio that counts as a regression")
+    parser.add_argument("--min-delta", type = float, default = MIN_DELTA, help = "smallest slowdown in seconds that counts as a regression")
+    parser.add_argument("--repeat", type = int, default = REPEAT, help = "timing samples per measurement, the best is kept")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.seed, not args.no_memory, args.only, args.max_size, args.repeat)
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent = 2, sort_keys = True)
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        regressions = compare(previous, results, args.threshold, args.min_delta)
+        for key, n, metric, old, new in regressions:
+            print("REGRESSION {} n={:,} {}: {:.4g} -> {:.4g} ({:.2f}x)".format(key, n, metric, old, new, new / old))
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
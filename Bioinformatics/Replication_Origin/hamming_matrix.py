@@ -0,0 +1,144 @@
+'''
+All-pairs Hamming distances for sets of kmers
+    Kmers are converted to 2-bit codes (see kmer_codec). Two kmers differ at a position exactly
+    when the XOR of their codes has either bit of that position's pair set, so
+    hamming_distance(a, b) == popcount((x | x >> 1) & 0b0101...01) with x = code(a) ^ code(b).
+
+    To compare one kmer against a whole tile of kmers at once, the tile's codes are packed side by
+    side into one big integer with a fixed field width. XOR with the query code repeated in every
+    field, then a SWAR (SIMD within a register) popcount, leaves the distance in the low byte of every
+    field, so a full row of distances costs a handful of big integer operations instead of a Python loop.
+'''
+from .kmer_codec import encode_kmers
+
+EVEN_BITS = b"\x55"
+PAIRS = b"\x33"
+NIBBLES = b"\x0f"
+
+def hamming_distance_numbers(number1, number2):
+    '''
+    Calculates the Hamming distance between two kmers of the same length from their numbers
+
+    INPUT:
+        number1(int), number2(int): numbers of two kmers (see pattern_to_number)
+    
+    OUTPUT:
+        (int): the number of positions at which the two kmers differ
+    '''
+    x = number1 ^ number2
+    # A 2-bit symbol differs if either of its bits differs; collect one bit per symbol at the even positions
+    x = (x | (x >> 1)) & int.from_bytes(EVEN_BITS * ((x.bit_length() + 8) // 8), "little")
+    return x.bit_count()
+
+def field_width(k):
+    '''
+    Smallest power of two bits, at least 8, that holds a 2k-bit code
+    '''
+    width = 8
+    while width < 2 * k:
+        width *= 2
+    return width
+
+def repeat_mask(pattern, n_bytes):
+    return int.from_bytes(pattern * (n_bytes // len(pattern)), "little")
+
+class Packed_Kmers:
+    def __init__(self, numbers, k):
+        '''
+        Packs kmer numbers into one big integer, field_width(k) bits per kmer
+
+        INPUT:
+            numbers(lst): numbers of kmers of length k
+            k(int): the length of the kmers
+        '''
+        if k > 255:
+            raise ValueError("kmers longer than 255 are not supported")
+        self.k = k
+        self.n = len(numbers)
+        self.width = field_width(k)
+        field_bytes = self.width // 8
+        self.n_bytes = self.n * field_bytes
+        self.packed = int.from_bytes(b"".join([number.to_bytes(field_bytes, "little") for number in numbers]), "little")
+        # query * repunit copies the query code into every field
+        self.repunit = repeat_mask(b"\x01" + b"\x00" * (field_bytes - 1), self.n_bytes)
+        self.even_bits = repeat_mask(EVEN_BITS, self.n_bytes)
+        self.pairs = repeat_mask(PAIRS, self.n_bytes)
+        self.nibbles = repeat_mask(NIBBLES, self.n_bytes)
+        # For each shift s >= 8, a mask keeping the low s bits of every 2s-bit block
+        self.block_masks = []
+        s = 8
+        while s < self.width:
+            self.block_masks.append((s, repeat_mask(b"\xff" * (s // 8) + b"\x00" * (s // 8), self.n_bytes)))
+            s *= 2
+
+    def distances(self, number):
+        '''
+        Hamming distances between one kmer and every packed kmer
+
+        INPUT:
+            number(int): number of the query kmer
+        
+        OUTPUT:
+            (bytes): distances[j] is the distance to the j-th packed kmer
+        '''
+        if self.n == 0:
+            return b""
+        x = self.packed ^ (number * self.repunit)
+        x = (x | (x >> 1)) & self.even_bits
+        x = (x & self.pairs) + ((x >> 2) & self.pairs)
+        x = (x + (x >> 4)) & self.nibbles
+        for s, mask in self.block_masks:
+            x = (x + (x >> s)) & mask
+        return x.to_bytes(self.n_bytes, "little")[::self.width // 8]
+
+def check_lengths(kmers):
+    k = len(kmers[0]) if kmers else 0
+    for kmer in kmers:
+        if len(kmer) != k:
+            raise ValueError("all kmers must have the same length")
+    return k
+
+def hamming_distance_matrix(kmers):
+    '''
+    Calculates the Hamming distance between every pair of kmers
+
+    INPUT:
+        kmers(lst): list of N strings of equal length
+    
+    OUTPUT:
+        matrix(lst): list of N bytes objects, matrix[i][j] is the Hamming distance between kmers[i] and kmers[j]
+    '''
+    kmers = list(kmers)
+    k = check_lengths(kmers)
+    numbers = encode_kmers(kmers)
+    packed = Packed_Kmers(numbers, k)
+    return [packed.distances(number) for number in numbers]
+
+def pairs_within_distance(kmers, d, tile_size = 4096):
+    '''
+    Finds all pairs of kmers that are at most d Hamming distance apart.
+    Columns are packed tile_size kmers at a time, so memory stays bounded for large N.
+
+    INPUT:
+        kmers(lst): list of N strings of equal length
+        d(int): the max Hamming distance between kmers of a pair
+        tile_size(int): number of kmers packed together per tile
+    
+    OUTPUT:
+        (generator): (i, j, distance) tuples with i < j and distance <= d
+    '''
+    kmers = list(kmers)
+    k = check_lengths(kmers)
+    numbers = encode_kmers(kmers)
+    # Maps every distance to 1 if it is within d, otherwise 0, so matches can be found with bytes.find
+    within = bytes(1 if distance <= d else 0 for distance in range(256))
+    for start in range(0, len(numbers), tile_size):
+        tile = Packed_Kmers(numbers[start:start + tile_size], k)
+        # Only rows above the tile's last column can have pairs with i < j
+        for i in range(min(start + tile_size, len(numbers))):
+            row = tile.distances(numbers[i])
+            hits = row.translate(within)
+            j = hits.find(1, max(i + 1 - start, 0))
+            while j != -1:
+                yield (i, start + j, row[j])
+                j = hits.find(1, j + 1)
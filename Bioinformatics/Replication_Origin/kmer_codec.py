@@ -0,0 +1,84 @@
+'''
+Bulk kmer codec
+    Encodes and decodes whole lists of kmers to and from the numbers used by
+    pattern_count_frequency.pattern_to_number and number_to_pattern, without recursion.
+
+    Encoding translates A, C, G, T to the digits 0, 1, 2, 3 with one str.translate call
+    and parses each kmer as a base 4 number with int(digits, 4).
+    Decoding writes each number as big-endian bytes (4 symbols per byte) and looks up
+    every byte in a table of all 256 possible 4-mers.
+'''
+from itertools import product
+
+SYMBOLS = "ACGT"
+TO_DIGITS = str.maketrans(SYMBOLS, "0123")
+# CHUNKS[b] is the 4-mer whose number is b, e.g. CHUNKS[0] = "AAAA", CHUNKS[27] = "ACGT"
+CHUNKS = ["".join(chunk) for chunk in product(SYMBOLS, repeat = 4)]
+
+def encode_kmer(pattern):
+    '''
+    Same as pattern_to_number(pattern)
+    '''
+    if not pattern:
+        return 0
+    return int(pattern.translate(TO_DIGITS), 4)
+
+def encode_kmers(patterns):
+    '''
+    Converts a list of patterns to numbers, same as [pattern_to_number(p) for p in patterns]
+
+    INPUT:
+        patterns(lst): list of nucleotide strings
+    
+    OUTPUT:
+        (lst): list of integers representing the patterns
+    '''
+    patterns = list(patterns)
+    digits = "\n".join(patterns).translate(TO_DIGITS)
+    if not digits:
+        return [0] * len(patterns)
+    return [int(d, 4) if d else 0 for d in digits.split("\n")]
+
+def encode_text(text, k):
+    '''
+    Converts every kmer of text to a number, in order of position,
+    same as [pattern_to_number(text[i:i+k]) for i in range(len(text) - k + 1)]
+
+    INPUT:
+        text(str): the string to read kmers from
+        k(int): the length of kmers
+    
+    OUTPUT:
+        (lst): list of integers representing the kmer starting at each index of text
+    '''
+    digits = text.translate(TO_DIGITS)
+    if k == 0:
+        return [0] * (len(text) + 1)
+    return [int(digits[i:i+k], 4) for i in range(len(digits) - k + 1)]
+
+def decode_kmer(number, k):
+    '''
+    Same as number_to_pattern(number, k)
+    '''
+    n_bytes = (k + 3) // 4
+    pattern = "".join([CHUNKS[b] for b in number.to_bytes(n_bytes, "big")])
+    return pattern[len(pattern) - k:]
+
+def decode_kmers(numbers, k):
+    '''
+    Converts a list of numbers to patterns of length k, same as [number_to_pattern(n, k) for n in numbers]
+
+    INPUT:
+        numbers(lst): list of integers between 0 and 4**k - 1
+        k(int): the length of the patterns
+    
+    OUTPUT:
+        (lst): list of patterns represented by the numbers
+    '''
+    n_bytes = (k + 3) // 4
+    # Every number takes n_bytes * 4 symbols, of which the first (n_bytes * 4 - k) are padding
+    width = n_bytes * 4
+    pad = width - k
+    raw = b"".join([number.to_bytes(n_bytes, "big") for number in numbers])
+    text = "".join([CHUNKS[b] for b in raw])
+    return [text[i+pad:i+width] for i in range(0, len(text), width)]
@@ -0,0 +1,242 @@
+'''
+Persistent kmer count index
+    Counts every kmer of a genome once and stores the counts on disk as a flat array of 4**k
+    unsigned 32-bit integers, indexed by pattern_to_number(kmer). The file is opened with mmap,
+    so later frequency queries are O(1) lookups instead of recounting the genome, and only the
+    pages that are touched get read.
+
+    File layout (little-endian):
+        header: magic b"KMER", version, k, genome length, the last k-1 bases of the genome
+        body: 4**k uint32 counts
+
+    Appending sequence updates the counts in place, using the stored last k-1 bases so kmers
+    that span the old end of the genome are counted too.
+'''
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+
+from .kmer_codec import decode_kmer, decode_kmers, encode_kmer
+
+MAGIC = b"KMER"
+VERSION = 1
+# magic, version, k, genome length, length of stored tail, tail bases
+HEADER = struct.Struct("<4sIIQI36s")
+HEADER_SIZE = 64
+MAX_K = 16
+SYMBOLS = {"A": 0, "C": 1, "G": 2, "T": 3}
+
+def count_kmers(counts, text, k):
+    '''
+    Adds the count of every kmer within text to counts.
+    Windows containing a symbol other than A, C, G or T are skipped.
+
+    INPUT:
+        counts(array): 4**k counts indexed by pattern_to_number(kmer), updated in place
+        text(str): the string to count kmers within
+        k(int): the length of kmers
+    '''
+    mask = 4**k - 1
+    code = 0
+    valid = 0
+    for char in text:
+        symbol = SYMBOLS.get(char)
+        if symbol is None:
+            valid = 0
+            continue
+        code = ((code << 2) | symbol) & mask
+        valid += 1
+        if valid >= k:
+            counts[code] += 1
+
+class Kmer_Index:
+    def __init__(self, path, writable = False):
+        '''
+        Opens an index file written by Kmer_Index.build
+
+        INPUT:
+            path(str): path to the index file
+            writable(bool): True = allow append() to update the file
+        '''
+        self.path = path
+        self.writable = writable
+        self._file = open(path, "r+b" if writable else "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, version, k, length, tail_length, tail = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("{} is not a kmer index file".format(path))
+        self.k = k
+        self.length = length
+        self.tail = tail[:tail_length].decode("ascii")
+        counts = memoryview(self._mmap)[HEADER_SIZE:HEADER_SIZE + 4 * 4**k].cast("I")
+        if sys.byteorder != "little":
+            # The file is little-endian; fall back to an in-memory swapped copy on big-endian machines
+            counts = array("I", counts)
+            counts.byteswap()
+        self.counts = counts
+
+    @classmethod
+    def build(cls, path, genome, k):
+        '''
+        Counts all kmers of genome and writes the index to path
+
+        INPUT:
+            path(str): path of the index file to create (overwritten if it exists)
+            genome(str): the genome to index
+            k(int): the length of kmers
+        
+        OUTPUT:
+            (Kmer_Index): the new index, opened for reading
+        '''
+        if not 1 <= k <= MAX_K:
+            raise ValueError("k must be between 1 and {}".format(MAX_K))
+        counts = array("I", [0]) * 4**k
+        count_kmers(counts, genome, k)
+        if sys.byteorder != "little":
+            counts.byteswap()
+        tail = genome[len(genome) - k + 1:] if k > 1 else ""
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, k, len(genome), len(tail), tail.encode("ascii")).ljust(HEADER_SIZE, b"\0"))
+            counts.tofile(f)
+        return cls(path)
+
+    def close(self):
+        if getattr(self, "counts", None) is not None:
+            if isinstance(self.counts, memoryview):
+                self.counts.release()
+            self.counts = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def count(self, pattern):
+        '''
+        Number of times pattern appears in the genome, including overlapping occurrences
+        '''
+        if len(pattern) != self.k:
+            raise ValueError("pattern must have length {}".format(self.k))
+        return self.counts[encode_kmer(pattern)]
+
+    def frequency_map(self):
+        '''
+        Same output as pattern_count_frequency.frequency_map(genome, k), read from the index
+
+        OUTPUT:
+            freq(dict): 
+                key = k-length substrings of genome
+                value = count of substring within genome
+        '''
+        numbers = [i for i, c in enumerate(self.counts) if c]
+        return dict(zip(decode_kmers(numbers, self.k), (self.counts[i] for i in numbers)))
+
+    def computing_frequencies(self):
+        '''
+        Same output as pattern_count_frequency.computing_frequencies(genome, k), read from the index
+        '''
+        return self.counts.tolist()
+
+    def most_frequent_pattern(self):
+        '''
+        Same output as pattern_count_frequency.most_frequent_pattern(genome, k), read from the index
+        '''
+        max_freq = max(self.counts)
+        if max_freq == 0:
+            return []
+        return decode_kmers([i for i, c in enumerate(self.counts) if c == max_freq], self.k)
+
+    def top(self, n):
+        '''
+        Finds the n most frequent kmers
+
+        OUTPUT:
+            (lst): list of (kmer, count) tuples, highest count first
+        '''
+        best = heapq.nlargest(n, ((c, i) for i, c in enumerate(self.counts) if c))
+        return [(decode_kmer(i, self.k), c) for c, i in best]
+
+    def could_clump(self, pattern, t):
+        '''
+        A kmer can only form an (L, t)-clump if it appears at least t times in the whole genome
+        '''
+        return self.count(pattern) >= t
+
+    def clump_candidates(self, t):
+        '''
+        Set of kmers appearing at least t times in the genome, the only kmers that can form (L, t)-clumps
+        '''
+        return set(decode_kmers([i for i, c in enumerate(self.counts) if c >= t], self.k))
+
+    def pattern_clump_finder(self, genome, L, t):
+        '''
+        Same output as pattern_count_frequency.pattern_clump_finder(genome, k, L, t),
+        but only kmers that appear at least t times in the whole genome are tracked in the sliding window
+
+        INPUT:
+            genome(str): the indexed genome (including anything appended), raises ValueError if its length differs
+            L(int): the length of the substring that encompasses a clump
+            t(int): the number of times a kmer needs to appear within substring
+        
+        OUTPUT:
+            kmers(set): a set of kmers that form clumps within genome
+        '''
+        if len(genome) != self.length:
+            raise ValueError("genome has length {}, but the index was built from {} bases".format(len(genome), self.length))
+        k = self.k
+        candidates = self.clump_candidates(t)
+        kmers = set()
+        if not candidates:
+            return kmers
+        window = {}
+        for i in range(min(L, len(genome)) - k + 1):
+            pattern = genome[i:i+k]
+            if pattern in candidates:
+                window[pattern] = window.get(pattern, 0) + 1
+        for pattern, value in window.items():
+            if value >= t:
+                kmers.add(pattern)
+        for i in range(1, len(genome) - L + 1):
+            first_pattern = genome[i-1:i-1+k]
+            if first_pattern in candidates:
+                window[first_pattern] -= 1
+            last_pattern = genome[i+L-k:i+L]
+            if last_pattern in candidates:
+                window[last_pattern] = window.get(last_pattern, 0) + 1
+                if window[last_pattern] >= t:
+                    kmers.add(last_pattern)
+        return kmers
+
+    def append(self, sequence):
+        '''
+        Adds the kmers created by appending sequence to the end of the indexed genome.
+        The index must have been opened with writable = True.
+
+        INPUT:
+            sequence(str): bases appended to the genome
+        '''
+        if not self.writable:
+            raise ValueError("index was opened read-only")
+        if not sequence:
+            return
+        k = self.k
+        text = self.tail + sequence
+        count_kmers(self.counts, text, k)
+        if sys.byteorder != "little":
+            swapped = array("I", self.counts)
+            swapped.byteswap()
+            self._mmap[HEADER_SIZE:HEADER_SIZE + 4 * 4**k] = swapped.tobytes()
+        self.length += len(sequence)
+        self.tail = text[len(text) - k + 1:] if k > 1 else ""
+        self._mmap[:HEADER_SIZE] = HEADER.pack(MAGIC, VERSION, k, self.length, len(self.tail), self.tail.encode("ascii")).ljust(HEADER_SIZE, b"\0")
+        self._mmap.flush()
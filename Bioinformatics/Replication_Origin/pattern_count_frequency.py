@@ -1,5 +1,8 @@
-import urllib.request
 from collections import defaultdict
+from .kmer_codec import decode_kmers
+
+# Byte value of each nucleotide's number (A 0, C 1, G 2, T 3), any other byte maps to 4
+SYMBOL_CODES = bytes("ACGT".index(chr(b)) if chr(b) in "ACGT" else 4 for b in range(256))
 
 def pattern_count(text, pattern):
     '''
@@ -173,7 +176,110 @@ def pattern_clump_finder(genome, k, L, t):
             kmers.add(last_pattern)
     return kmers
 
+def strand_numbers(text, k):
+    '''
+    Finds the numbers of the kmer at each position and of its reverse complement in one rolling pass,
+    without building the reverse complement of text.
+    Windows that contain anything other than A, C, G or T (e.g. N) are skipped
+
+    INPUT:
+        text(str): the string to read kmers from
+        k(int): the length of kmers, at least 1
+
+    OUTPUT:
+        (generator): (position, pattern_to_number(kmer), pattern_to_number(reverse_complement(kmer))) for each kmer
+    '''
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    mask = 4**k - 1
+    shift = 2 * (k - 1)
+    forward = 0
+    reverse = 0
+    # Number of valid symbols read since the last invalid one
+    run = 0
+    for i, symbol in enumerate(text.encode("ascii", "replace").translate(SYMBOL_CODES)):
+        if symbol == 4:
+            run = 0
+            continue
+        # The new symbol is the last digit of the forward number and, complemented (3 - symbol), the first of the reverse
+        forward = ((forward << 2) | symbol) & mask
+        reverse = (reverse >> 2) | ((3 - symbol) << shift)
+        run += 1
+        if run >= k:
+            yield i - k + 1, forward, reverse
+
+def canonical_computing_frequencies(text, k, both_strands = False):
+    '''
+    Creates a frequency list of k length patterns that counts both strands of the text in a single scan
+
+    INPUT:
+        text(str): the string to map through
+        k(int): the length of the substrings to find within text
+        both_strands(bool):
+            False = canonical counts: each kmer and its reverse complement are counted together
+            under the smaller of their two numbers, and the other index stays 0
+            True = each kmer is counted at its own number and at its reverse complement's number,
+            as if text and its reverse complement had both been counted
+
+    OUTPUT:
+        freq_array(lst): a list of counts with each index pointing to the number representing the pattern
+    '''
+    freq_array = [0] * (4**k)
+    if both_strands:
+        for _, forward, reverse in strand_numbers(text, k):
+            freq_array[forward] += 1
+            freq_array[reverse] += 1
+    else:
+        for _, forward, reverse in strand_numbers(text, k):
+            freq_array[forward if forward < reverse else reverse] += 1
+    return freq_array
+
+def canonical_frequency_map(text, k, both_strands = False):
+    '''
+    Creates a frequency map of k length patterns that counts both strands of the text in a single scan.
+    A palindromic kmer (its own reverse complement) is counted once per occurrence as a canonical kmer,
+    and twice with both_strands since it occurs on both strands
+
+    INPUT:
+        text(str): the string to map through
+        k(int): the length of the substrings to find within text
+        both_strands(bool): False = key each count by the canonical kmer (the lexicographically smaller of
+            a kmer and its reverse complement), True = count every kmer and its reverse complement
+
+    OUTPUT:
+        freq(dict):
+            key = k-length patterns
+            value = count of the pattern on either strand of text
+    '''
+    counts = defaultdict(lambda: 0)
+    if both_strands:
+        for _, forward, reverse in strand_numbers(text, k):
+            counts[forward] += 1
+            counts[reverse] += 1
+    else:
+        for _, forward, reverse in strand_numbers(text, k):
+            counts[forward if forward < reverse else reverse] += 1
+    numbers = list(counts)
+    freq = defaultdict(lambda: 0)
+    freq.update(zip(decode_kmers(numbers, k), (counts[number] for number in numbers)))
+    return freq
+
+def most_frequent_canonical_pattern(text, k, both_strands = False):
+    '''
+    Find the most frequent patterns of length k counting both strands of text,
+    see canonical_frequency_map for what both_strands changes
+
+    OUTPUT:
+        patterns(lst): a list of k-length patterns with the highest frequency
+    '''
+    freq = canonical_frequency_map(text, k, both_strands)
+    if not freq:
+        return []
+    max_freq = max(freq.values())
+    return [pattern for pattern in freq if freq[pattern] == max_freq]
+
 if __name__ == "__main__":
+    import urllib.request
     text = urllib.request.urlopen("http://bioinformaticsalgorithms.com/data/realdatasets/Rearrangements/E_coli.txt").read()
     k = 9
     L = 500
@@ -1,8 +1,8 @@
-import urllib.request
-import approximate_patterns
-import skew_diagram
+from . import approximate_patterns
+from . import skew_diagram
 
 if __name__ == "__main__":
+    import urllib.request
     genome = urllib.request.urlopen("http://bioinformaticsalgorithms.com/data/Salmonella_enterica.txt").read()
     # decode from byte to string
     genome = genome.decode("utf-8")
@@ -10,11 +10,12 @@ if __name__ == "__main__":
     genome = genome.split("\r\n")
     # convert list back to string, without the first and last lines
     genome = "".join(genome[1:len(genome)-1])
-    dnaa_boxes = []
-    for potential_ori in skew_diagram.minimum_skew(genome):
-        ori_window = genome[(potential_ori - 500):(potential_ori + 500)]
-        k = 9
-        d = 1
-        d_box = approximate_patterns.most_frequent_approx_pattern(ori_window, k, d)
-        dnaa_boxes.append(d_box)
-    print(dnaa_boxes)
+    # Instead of guessing a window around the minimum skew, scan the whole genome for 9-mers
+    # that appear (with up to 1 mismatch, on either strand) at least t times within 1000 bases
+    k = 9
+    L = 1000
+    t = 8
+    d = 1
+    dnaa_boxes = approximate_patterns.approx_clump_finder(genome, k, L, t, d)
+    print("Minimum skew positions: {}".format(skew_diagram.minimum_skew(genome)))
+    print(sorted(dnaa_boxes))
@@ -7,7 +7,7 @@
     # Overall, this leads to a decrease of C in the forward strand and a decrease in G in the reverse strand
 
 # Analyzing Genome Halfstrands: since bacterial DNA is circular, we have to account for windows that wrap around the end of genome
-from pattern_count_frequency import pattern_count
+from .pattern_count_frequency import pattern_count
 
 def symbol_array(genome, symbol):
     '''
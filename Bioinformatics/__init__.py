@@ -0,0 +1,9 @@
+'''
+Bioinformatics algorithms
+
+    Replication_Origin: finding the origin of replication (skew, frequent words, clumps, approximate patterns)
+    Molecular_Clock: finding regulatory motifs (greedy, randomized and Gibbs sampling motif search)
+
+Submodules are not imported here, so importing the package does no work.
+Run `python -m Bioinformatics --help` for the command line interface.
+'''
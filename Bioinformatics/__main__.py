@@ -0,0 +1,122 @@
+'''
+Command line interface for the Bioinformatics algorithms.
+Each subcommand imports only the module it needs, so startup stays cheap.
+
+    python -m Bioinformatics skew genome.txt
+    python -m Bioinformatics clumps genome.txt -k 9 -L 500 -t 3
+    python -m Bioinformatics approx-frequent genome.txt -k 9 -d 1
+    python -m Bioinformatics approx-clumps genome.txt -k 9 -L 1000 -t 8 -d 1
+    python -m Bioinformatics motifs dna.txt -k 15 --method gibbs
+'''
+import argparse
+import sys
+
+def read_sequences(path):
+    '''
+    Reads DNA strings from a file, or from stdin if path is "-".
+    Blank lines and FASTA header lines (starting with ">") are skipped.
+
+    INPUT:
+        path(str): path to the file to read
+    
+    OUTPUT:
+        sequences(lst): list of upper case DNA strings, one per line of the file
+    '''
+    handle = sys.stdin if path == "-" else open(path)
+    try:
+        sequences = []
+        for line in handle:
+            line = line.strip()
+            if line and not line.startswith(">"):
+                sequences.append(line.upper())
+        return sequences
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+def read_genome(path):
+    '''
+    Reads a genome from a file, joining all of its lines into one string
+    '''
+    return "".join(read_sequences(path))
+
+def skew(args):
+    from .Replication_Origin.skew_diagram import minimum_skew
+    print(" ".join(str(i) for i in minimum_skew(read_genome(args.genome))))
+
+def clumps(args):
+    from .Replication_Origin.pattern_count_frequency import pattern_clump_finder
+    print(" ".join(sorted(pattern_clump_finder(read_genome(args.genome), args.k, args.L, args.t))))
+
+def approx_frequent(args):
+    from .Replication_Origin.approximate_patterns import most_frequent_approx_pattern
+    print(" ".join(sorted(most_frequent_approx_pattern(read_genome(args.genome), args.k, args.d))))
+
+def approx_clumps(args):
+    from .Replication_Origin.approximate_patterns import approx_clump_finder
+    print(" ".join(sorted(approx_clump_finder(read_genome(args.genome), args.k, args.L, args.t, args.d, not args.forward_only))))
+
+def motifs(args):
+    from .Molecular_Clock import motif_finding
+    dna = read_sequences(args.dna)
+    t = len(dna)
+    if args.method == "greedy":
+        best_motifs = motif_finding.greedy_motif_search(dna, args.k, t, args.pseudo)
+    else:
+        best_motifs = None
+        for _ in range(args.runs):
+            if args.method == "randomized":
+                matrix = motif_finding.randomized_motif_search(dna, args.k, t)
+            else:
+                matrix = motif_finding.gibbs_sampler(dna, args.k, t, args.iterations)
+            if best_motifs is None or motif_finding.motifs_matrix_score(matrix) < motif_finding.motifs_matrix_score(best_motifs):
+                best_motifs = matrix
+    print("\n".join(best_motifs))
+    print(motif_finding.motifs_matrix_score(best_motifs))
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m Bioinformatics", description="Bioinformatics algorithms")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_skew = subparsers.add_parser("skew", help="positions where the G-C skew is minimum")
+    parser_skew.add_argument("genome", help="genome file, or - for stdin")
+    parser_skew.set_defaults(func=skew)
+
+    parser_clumps = subparsers.add_parser("clumps", help="kmers forming (L, t)-clumps")
+    parser_clumps.add_argument("genome", help="genome file, or - for stdin")
+    parser_clumps.add_argument("-k", type=int, required=True, help="length of kmers")
+    parser_clumps.add_argument("-L", type=int, required=True, help="length of the clump window")
+    parser_clumps.add_argument("-t", type=int, required=True, help="minimum occurrences within window")
+    parser_clumps.set_defaults(func=clumps)
+
+    parser_approx = subparsers.add_parser("approx-frequent", help="most frequent kmers with up to d mismatches and reverse complements")
+    parser_approx.add_argument("genome", help="genome file, or - for stdin")
+    parser_approx.add_argument("-k", type=int, required=True, help="length of kmers")
+    parser_approx.add_argument("-d", type=int, required=True, help="maximum number of mismatches")
+    parser_approx.set_defaults(func=approx_frequent)
+
+    parser_approx_clumps = subparsers.add_parser("approx-clumps", help="kmers forming (L, t)-clumps with up to d mismatches")
+    parser_approx_clumps.add_argument("genome", help="genome file, or - for stdin")
+    parser_approx_clumps.add_argument("-k", type=int, required=True, help="length of kmers")
+    parser_approx_clumps.add_argument("-L", type=int, required=True, help="length of the clump window")
+    parser_approx_clumps.add_argument("-t", type=int, required=True, help="minimum approximate occurrences within window")
+    parser_approx_clumps.add_argument("-d", type=int, required=True, help="maximum number of mismatches")
+    parser_approx_clumps.add_argument("--forward-only", action="store_true", help="do not count reverse complements")
+    parser_approx_clumps.set_defaults(func=approx_clumps)
+
+    parser_motifs = subparsers.add_parser("motifs", help="best motif matrix across DNA strings")
+    parser_motifs.add_argument("dna", help="file with one DNA string per line, or - for stdin")
+    parser_motifs.add_argument("-k", type=int, required=True, help="length of motifs")
+    parser_motifs.add_argument("--method", choices=["greedy", "randomized", "gibbs"], default="greedy")
+    parser_motifs.add_argument("--pseudo", action="store_true", help="use pseudocounts (greedy only)")
+    parser_motifs.add_argument("--runs", type=int, default=20, help="number of restarts (randomized/gibbs)")
+    parser_motifs.add_argument("--iterations", type=int, default=100, help="sampling iterations per run (gibbs)")
+    parser_motifs.set_defaults(func=motifs)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+'''
+Linked list benchmark suite
+    Times addHead, addTail, addAtIndex, get and deleteAtIndex on Linked_List, Indexable_Skip_List
+    and Unrolled_Linked_List next to the built-in list and collections.deque, at sizes from 10^3 to 10^6,
+    records the bytes each structure adds to hold n values (not counting the values themselves)
+    and the peak memory of each batch of operations (with tracemalloc), and writes the results to a JSON file.
+
+    python benchmark.py --output bench.json
+    python benchmark.py --sizes 1000 10000 --only Linked_List list deque
+'''
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from functools import partial
+
+from classes import Linked_List
+from skip_list import Indexable_Skip_List
+from unrolled_list import Unrolled_Linked_List
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+OPERATIONS = 1000
+
+def fill(structure, values):
+    for val in values:
+        structure.addTail(val)
+    return structure
+
+def fill_unrolled(values):
+    structure = Unrolled_Linked_List()
+    structure.extend(values)
+    return structure
+
+# Each operation maps a structure to the callable that does it, so every structure
+# is called the same way: once per argument tuple, through a bound method.
+LINKED_OPERATIONS = {
+    "addHead": lambda s: s.addHead,
+    "addTail": lambda s: s.addTail,
+    "addAtIndex": lambda s: s.addAtIndex,
+    "get": lambda s: s.get,
+    "deleteAtIndex": lambda s: s.deleteAtIndex,
+}
+LIST_OPERATIONS = {
+    "addHead": lambda s: partial(s.insert, 0),
+    "addTail": lambda s: s.append,
+    "addAtIndex": lambda s: s.insert,
+    "get": lambda s: s.__getitem__,
+    "deleteAtIndex": lambda s: s.__delitem__,
+}
+DEQUE_OPERATIONS = dict(LIST_OPERATIONS, addHead = lambda s: s.appendleft)
+
+# Each structure is (function building it from a list of values, its operations)
+STRUCTURES = {
+    "Linked_List": (lambda values: fill(Linked_List(), values), LINKED_OPERATIONS),
+    "Indexable_Skip_List": (lambda values: fill(Indexable_Skip_List(0), values), LINKED_OPERATIONS),
+    "Unrolled_Linked_List": (fill_unrolled, LINKED_OPERATIONS),
+    "list": (list, LIST_OPERATIONS),
+    "deque": (deque, DEQUE_OPERATIONS),
+}
+
+# Largest size to run each (structure, operation) on. Linked_List walks to a random index in O(n),
+# so a thousand of them on a million nodes would take minutes.
+CAPS = {
+    ("Linked_List", "addAtIndex"): 100_000,
+    ("Linked_List", "get"): 100_000,
+    ("Linked_List", "deleteAtIndex"): 100_000,
+}
+
+def arguments(operation, size, count, rng):
+    '''
+    Random arguments for count calls of an operation on a structure holding size values.
+    Indexes are uniform over the positions that are valid at the time of each call.
+
+    OUTPUT:
+        (lst): list of argument tuples
+    '''
+    if operation in ("addHead", "addTail"):
+        return [(i,) for i in range(count)]
+    if operation == "addAtIndex":
+        return [(rng.randint(0, size + i), i) for i in range(count)]
+    if operation == "get":
+        return [(rng.randrange(size),) for _ in range(count)]
+    if operation == "deleteAtIndex":
+        return [(rng.randrange(size - i),) for i in range(count)]
+    raise ValueError("Unknown operation {}".format(operation))
+
+def structure_bytes(build, values):
+    '''
+    Bytes allocated to build a structure holding values, beyond the values themselves:
+    the values already exist before tracing starts, so only the structure is counted
+
+    OUTPUT:
+        (int): bytes held by the structure once it is built
+    '''
+    tracemalloc.start()
+    try:
+        structure = build(values)
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return held
+
+def measure(build, binder, operation, values, count, rng, memory = True):
+    '''
+    Runs count calls of an operation on a fresh structure of the values for wall time,
+    then the same number on another fresh structure under tracemalloc for peak memory
+
+    OUTPUT:
+        (dict): operations, seconds, ops_per_second and peak_bytes (None if memory is False)
+    '''
+    n = len(values)
+    structure = build(values)
+    call = binder(structure)
+    args = arguments(operation, n, count, rng)
+    start = time.perf_counter()
+    for a in args:
+        call(*a)
+    seconds = time.perf_counter() - start
+    peak = None
+    if memory:
+        structure = build(values)
+        call = binder(structure)
+        args = arguments(operation, n, count, rng)
+        tracemalloc.start()
+        try:
+            for a in args:
+                call(*a)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {
+        "operations": count,
+        "seconds": seconds,
+        "ops_per_second": count / seconds if seconds > 0 else None,
+        "peak_bytes": peak,
+    }
+
+def run(sizes = SIZES, operations = OPERATIONS, seed = 0, memory = True, only = None, max_size = None, log = sys.stderr):
+    '''
+    Benchmarks every operation of every structure at each size
+
+    INPUT:
+        sizes(lst): numbers of values each structure holds before the operations
+        operations(int): number of calls of each operation to time
+        seed(int): seed for the random indexes
+        memory(bool): True = also record memory with tracemalloc
+        only(lst): if given, only benchmark structures and operations with these names
+        max_size(int): if given, overrides every size cap
+        log(file): where to print progress, None for silence
+
+    OUTPUT:
+        results(dict): run metadata and, for each structure, the bytes per value it adds and each operation's measurements
+    '''
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "operations": operations,
+        "structures": {},
+    }
+    rng = random.Random(seed)
+    # --only can name structures, operations or both; naming none of one kind means all of that kind
+    only = set(only or [])
+    only_structures = only & set(STRUCTURES)
+    only_operations = only - only_structures
+    for n in sorted(sizes):
+        values = list(range(n))
+        for name, (build, binders) in STRUCTURES.items():
+            if only_structures and name not in only_structures:
+                continue
+            entry = results["structures"].setdefault(name, {"bytes_per_value": {}, "operations": {}})
+            if memory:
+                entry["bytes_per_value"][str(n)] = structure_bytes(build, values) / n
+            for operation, binder in binders.items():
+                if only_operations and operation not in only_operations:
+                    continue
+                cap = max_size if max_size is not None else CAPS.get((name, operation))
+                runs = entry["operations"].setdefault(operation, {"runs": {}, "skipped": []})
+                if cap is not None and n > cap:
+                    runs["skipped"].append(n)
+                    continue
+                # Deleting more values than the structure holds would run out of valid indexes
+                count = min(operations, n // 2) if operation == "deleteAtIndex" else operations
+                runs["runs"][str(n)] = measure(build, binder, operation, values, count, rng, memory)
+                if log:
+                    result = runs["runs"][str(n)]
+                    peak = "" if result["peak_bytes"] is None else " {:>12,} B".format(result["peak_bytes"])
+                    print("{:<22} {:<14} {:>10,} {:>14,.0f} ops/s{}".format(name, operation, n, result["ops_per_second"] or 0, peak), file = log)
+    return results
+
+def print_report(results, out = sys.stdout):
+    '''
+    Prints ops per second of each operation and structure at the largest size every structure ran,
+    followed by the bytes per value each structure adds on top of the values
+    '''
+    structures = results["structures"]
+    operations = []
+    for entry in structures.values():
+        operations.extend(operation for operation in entry["operations"] if operation not in operations)
+    print("{:<14} {:>10}".format("operation", "n") + "".join(" {:>22}".format(name) for name in structures), file = out)
+    for operation in operations:
+        ran = [set(entry["operations"].get(operation, {}).get("runs", {})) for entry in structures.values()]
+        common = set.intersection(*ran) if ran else set()
+        if not common:
+            continue
+        n = max(common, key = int)
+        line = "{:<14} {:>10,}".format(operation, int(n))
+        for entry in structures.values():
+            line += " {:>22,.0f}".format(entry["operations"][operation]["runs"][n]["ops_per_second"] or 0)
+        print(line, file = out)
+    for name, entry in structures.items():
+        sizes = entry["bytes_per_value"]
+        if sizes:
+            n = max(sizes, key = int)
+            print("{:<22} {:>8.1f} bytes per value (structure only, not the values) at n = {:,}".format(name, sizes[n], int(n)), file = out)
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmark the linked lists against list and deque")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = SIZES, help = "number of values in each structure")
+    parser.add_argument("--operations", type = int, default = OPERATIONS, help = "calls of each operation to time")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--only", nargs = "+", help = "only benchmark these structures and/or operations")
+    parser.add_argument("--max-size", type = int, help = "override the per-operation size caps")
+    parser.add_argument("--no-memory", action = "store_true", help = "skip the tracemalloc memory runs")
+    parser.add_argument("--output", help = "write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.operations, args.seed, not args.no_memory, args.only, args.max_size)
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent = 2, sort_keys = True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
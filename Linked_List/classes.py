@@ -1,31 +1,48 @@
 class Node:
-    def __init__(self, val = None, next_node = None):
+    # No per-node __dict__, which roughly halves the memory of each node
+    __slots__ = ("val", "next_node", "prev_node")
+
+    def __init__(self, val = None, next_node = None, prev_node = None):
         self.val = val
         self.next_node = next_node
+        self.prev_node = prev_node
 
     def __str__(self):
         return "My value is {}".format(self.val)
 
 class Linked_List:
+    # Doubly linked with a tail pointer, so both ends can be changed in O(1)
     def __init__(self):
         self.head = None
+        self.tail = None
         self.size = 0
 
+    def nodeAt(self, index):
+        # Walk from whichever end is closer
+        if index < self.size // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.next_node
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - index):
+                current = current.prev_node
+        return current
+
     def get(self, index):
         if index >= self.size or index < 0:
             return print("Invalid Index!")
-        current = self.head
-        for _ in range(index):
-            current = current.next_node
-        return current.val
-    
+        return self.nodeAt(index).val
+
     def addHead(self, val):
-        new_next = None
-        if self.head is not None:
-            new_next = self.head
-        self.head = Node(val, new_next)
+        new_node = Node(val, self.head)
+        if self.head is None:
+            self.tail = new_node
+        else:
+            self.head.prev_node = new_node
+        self.head = new_node
         self.size += 1
-    
+
     def addAtIndex(self, index, val):
         if index < 0 or index > self.size:
             return print("Invalid Index!")
@@ -33,37 +50,32 @@ class Linked_List:
             return self.addHead(val)
         if index == self.size:
             return self.addTail(val)
-        current = self.head
-        for _ in range(1, index):
-            current = current.next_node
-        new_next = current.next_node
-        current.next_node = Node(val, new_next)
+        current = self.nodeAt(index - 1)
+        new_node = Node(val, current.next_node, current)
+        current.next_node.prev_node = new_node
+        current.next_node = new_node
         self.size += 1
 
     def addTail(self, val):
-        if self.head is None:
-            self.head = Node(val)
+        new_node = Node(val, None, self.tail)
+        if self.tail is None:
+            self.head = new_node
         else:
-            current = self.head
-            while current.next_node is not None:
-                current = current.next_node
-            current.next_node = Node(val)
+            self.tail.next_node = new_node
+        self.tail = new_node
         self.size += 1
 
     def deleteAtIndex(self, index):
         if index < 0 or index >= self.size:
             return print("Invalid Index!")
-        if index == 0:
-            to_delete = self.head
-            self.head = self.head.next_node
-            del to_delete
+        to_delete = self.nodeAt(index)
+        if to_delete.prev_node is None:
+            self.head = to_delete.next_node
         else:
-            current = self.head
-            node_before = None
-            for i in range(index):
-                if i == (index - 1):
-                    node_before = current
-                current = current.next_node
-            node_before.next_node = current.next_node
-            del current
+            to_delete.prev_node.next_node = to_delete.next_node
+        if to_delete.next_node is None:
+            self.tail = to_delete.prev_node
+        else:
+            to_delete.next_node.prev_node = to_delete.prev_node
+        del to_delete
         self.size -= 1
@@ -0,0 +1,124 @@
+'''
+Persistent (immutable) linked list.
+Methods never change a list; they return a new version that shares every node it can with the old one.
+addHead and deleting the head are O(1), and older versions stay valid, so a reader can hold on to a
+version as a free snapshot while a writer keeps making new ones.
+Changes further in copy only the nodes before the changed position.
+'''
+import sys
+
+class Persistent_Node:
+    __slots__ = ("val", "next_node")
+
+    def __init__(self, val = None, next_node = None):
+        self.val = val
+        self.next_node = next_node
+
+    def __str__(self):
+        return "My value is {}".format(self.val)
+
+class Persistent_Linked_List:
+    __slots__ = ("head", "size")
+
+    def __init__(self, head = None, size = 0):
+        self.head = head
+        self.size = size
+
+    @classmethod
+    def fromIterable(cls, iterable):
+        head = None
+        size = 0
+        for val in reversed(list(iterable)):
+            head = Persistent_Node(val, head)
+            size += 1
+        return cls(head, size)
+
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            yield current.val
+            current = current.next_node
+
+    def __len__(self):
+        return self.size
+
+    def get(self, index):
+        if index >= self.size or index < 0:
+            return print("Invalid Index!")
+        return self.nodeAt(index).val
+
+    def addHead(self, val):
+        return Persistent_Linked_List(Persistent_Node(val, self.head), self.size + 1)
+
+    def deleteHead(self):
+        if self.head is None:
+            print("Invalid Index!")
+            return self
+        return Persistent_Linked_List(self.head.next_node, self.size - 1)
+
+    def nodeAt(self, index):
+        current = self.head
+        for _ in range(index):
+            current = current.next_node
+        return current
+
+    def copyBefore(self, index, rest):
+        # New nodes for the values before index, followed by rest, which is shared with this version
+        values = []
+        current = self.head
+        for _ in range(index):
+            values.append(current.val)
+            current = current.next_node
+        for val in reversed(values):
+            rest = Persistent_Node(val, rest)
+        return rest
+
+    def addAtIndex(self, index, val):
+        if index < 0 or index > self.size:
+            print("Invalid Index!")
+            return self
+        if index == 0:
+            return self.addHead(val)
+        head = self.copyBefore(index, Persistent_Node(val, self.nodeAt(index)))
+        return Persistent_Linked_List(head, self.size + 1)
+
+    def addTail(self, val):
+        return self.addAtIndex(self.size, val)
+
+    def deleteAtIndex(self, index):
+        if index < 0 or index >= self.size:
+            print("Invalid Index!")
+            return self
+        if index == 0:
+            return self.deleteHead()
+        head = self.copyBefore(index, self.nodeAt(index).next_node)
+        return Persistent_Linked_List(head, self.size - 1)
+
+def memory_usage(versions):
+    '''
+    Bytes used by a collection of versions, counting each shared node only once
+
+    INPUT:
+        versions(lst): list of Persistent_Linked_List versions
+
+    OUTPUT:
+        (dict): number of versions, distinct nodes and total bytes of the list objects and nodes
+    '''
+    seen = set()
+    total = 0
+    for version in versions:
+        total += sys.getsizeof(version)
+        current = version.head
+        # Once a node has been counted, everything after it has been counted too
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            total += sys.getsizeof(current)
+            current = current.next_node
+    return {"versions": len(versions), "nodes": len(seen), "bytes": total}
+
+if __name__ == "__main__":
+    base = Persistent_Linked_List.fromIterable(range(100000))
+    versions = [base]
+    for i in range(1000):
+        versions.append(versions[-1].addHead(i))
+    print("1000 versions of a 100000 element list:", memory_usage(versions))
@@ -0,0 +1,144 @@
+'''
+Indexable skip list with the same methods as Linked_List.
+Every forward link also stores its span, the number of positions it skips,
+so get, addAtIndex and deleteAtIndex find a position in O(log n) expected time.
+
+Run this file to check it against Linked_List with random operations.
+'''
+import random
+
+MAX_LEVEL = 32
+# Chance that a node reaches the next level up
+P = 0.5
+
+class Skip_Node:
+    __slots__ = ("val", "next_nodes", "spans")
+
+    def __init__(self, val = None, level = 1):
+        self.val = val
+        # next_nodes[l] is the next node at level l, spans[l] is how many positions ahead it is
+        self.next_nodes = [None] * level
+        self.spans = [0] * level
+
+    def __str__(self):
+        return "My value is {}".format(self.val)
+
+class Indexable_Skip_List:
+    def __init__(self, seed = None):
+        # The head sits at position -1, and links to the end point at position size
+        self.head = Skip_Node(None, MAX_LEVEL)
+        self.level = 1
+        self.head.spans[0] = 1
+        self.size = 0
+        self.random = random.Random(seed)
+
+    def randomLevel(self):
+        level = 1
+        while level < MAX_LEVEL and self.random.random() < P:
+            level += 1
+        return level
+
+    def findBefore(self, index):
+        # For each level, the last node before position index and that node's position
+        update = [None] * self.level
+        ranks = [0] * self.level
+        current = self.head
+        position = -1
+        for level in range(self.level - 1, -1, -1):
+            while current.next_nodes[level] is not None and position + current.spans[level] < index:
+                position += current.spans[level]
+                current = current.next_nodes[level]
+            update[level] = current
+            ranks[level] = position
+        return update, ranks
+
+    def get(self, index):
+        if index >= self.size or index < 0:
+            return print("Invalid Index!")
+        current = self.head
+        position = -1
+        for level in range(self.level - 1, -1, -1):
+            while current.next_nodes[level] is not None and position + current.spans[level] <= index:
+                position += current.spans[level]
+                current = current.next_nodes[level]
+            if position == index:
+                break
+        return current.val
+
+    def addHead(self, val):
+        self.addAtIndex(0, val)
+
+    def addAtIndex(self, index, val):
+        if index < 0 or index > self.size:
+            return print("Invalid Index!")
+        new_level = self.randomLevel()
+        update, ranks = self.findBefore(index)
+        if new_level > self.level:
+            for level in range(self.level, new_level):
+                self.head.next_nodes[level] = None
+                self.head.spans[level] = self.size + 1
+                update.append(self.head)
+                ranks.append(-1)
+            self.level = new_level
+        new_node = Skip_Node(val, new_level)
+        for level in range(new_level):
+            before = update[level]
+            # before's old link reached position ranks + span, which moves up by one after the insert
+            new_node.next_nodes[level] = before.next_nodes[level]
+            new_node.spans[level] = ranks[level] + before.spans[level] + 1 - index
+            before.next_nodes[level] = new_node
+            before.spans[level] = index - ranks[level]
+        for level in range(new_level, self.level):
+            update[level].spans[level] += 1
+        self.size += 1
+
+    def addTail(self, val):
+        self.addAtIndex(self.size, val)
+
+    def deleteAtIndex(self, index):
+        if index < 0 or index >= self.size:
+            return print("Invalid Index!")
+        update, _ = self.findBefore(index)
+        to_delete = update[0].next_nodes[0]
+        for level in range(self.level):
+            before = update[level]
+            if before.next_nodes[level] is to_delete:
+                before.spans[level] += to_delete.spans[level] - 1
+                before.next_nodes[level] = to_delete.next_nodes[level]
+            else:
+                before.spans[level] -= 1
+        while self.level > 1 and self.head.next_nodes[self.level - 1] is None:
+            self.level -= 1
+        del to_delete
+        self.size -= 1
+
+def differential_check(n_operations = 100000, seed = 0):
+    '''
+    Runs the same random operations (including invalid indexes) on an Indexable_Skip_List
+    and a Linked_List and checks that they return and print the same things.
+    Raises AssertionError on the first difference.
+    '''
+    import contextlib
+    import io
+    from classes import Linked_List
+
+    rng = random.Random(seed)
+    skip_list = Indexable_Skip_List(seed)
+    linked_list = Linked_List()
+    for step in range(n_operations):
+        operation = rng.choice(["get", "get", "addHead", "addTail", "addAtIndex", "addAtIndex", "deleteAtIndex", "deleteAtIndex"])
+        args = [] if operation in ("addHead", "addTail") else [rng.randint(-2, linked_list.size + 2)]
+        if operation.startswith("add"):
+            args.append(rng.random())
+        results = []
+        for structure in (skip_list, linked_list):
+            with contextlib.redirect_stdout(io.StringIO()) as printed:
+                result = getattr(structure, operation)(*args)
+            results.append((result, printed.getvalue(), structure.size))
+        assert results[0] == results[1], "step {}: {}{} gave {} vs {}".format(step, operation, tuple(args), results[0], results[1])
+    assert [skip_list.get(i) for i in range(skip_list.size)] == [linked_list.get(i) for i in range(linked_list.size)]
+
+if __name__ == "__main__":
+    for seed in range(10):
+        differential_check(20000, seed)
+    print("Indexable_Skip_List matches Linked_List")
@@ -0,0 +1,148 @@
+'''
+Unrolled linked list with the same methods as Linked_List.
+Each block holds up to capacity values in one contiguous list instead of one node per value,
+so iteration touches a few large arrays rather than chasing a pointer per value, and each value
+costs a list slot (8 bytes) instead of a whole node.
+'''
+from itertools import islice
+
+CAPACITY = 64
+
+class Block:
+    __slots__ = ("values", "next_block")
+
+    def __init__(self, values = None, next_block = None):
+        self.values = values if values is not None else []
+        self.next_block = next_block
+
+    def __str__(self):
+        return "My values are {}".format(self.values)
+
+class Unrolled_Linked_List:
+    def __init__(self, capacity = CAPACITY):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def __iter__(self):
+        block = self.head
+        while block is not None:
+            yield from block.values
+            block = block.next_block
+
+    def __len__(self):
+        return self.size
+
+    def findBlock(self, index):
+        # The block where a value inserted at index goes, and the position within that block
+        block = self.head
+        while index > len(block.values) or (index == len(block.values) and block.next_block is not None):
+            index -= len(block.values)
+            block = block.next_block
+        return block, index
+
+    def get(self, index):
+        if index >= self.size or index < 0:
+            return print("Invalid Index!")
+        block = self.head
+        while index >= len(block.values):
+            index -= len(block.values)
+            block = block.next_block
+        return block.values[index]
+
+    def addHead(self, val):
+        self.addAtIndex(0, val)
+
+    def addAtIndex(self, index, val):
+        if index < 0 or index > self.size:
+            return print("Invalid Index!")
+        if self.head is None:
+            self.head = self.tail = Block([val])
+            self.size += 1
+            return
+        if index == self.size:
+            return self.addTail(val)
+        block, position = self.findBlock(index)
+        block.values.insert(position, val)
+        if len(block.values) > self.capacity:
+            self.split(block)
+        self.size += 1
+
+    def addTail(self, val):
+        if self.tail is None:
+            self.head = self.tail = Block([val])
+        elif len(self.tail.values) < self.capacity:
+            self.tail.values.append(val)
+        else:
+            self.tail.next_block = Block([val])
+            self.tail = self.tail.next_block
+        self.size += 1
+
+    def extend(self, iterable):
+        # Fill the tail block, then add full blocks straight from the iterable
+        iterator = iter(iterable)
+        if self.tail is not None:
+            room = self.capacity - len(self.tail.values)
+            before = len(self.tail.values)
+            self.tail.values.extend(islice(iterator, room))
+            self.size += len(self.tail.values) - before
+        while True:
+            values = list(islice(iterator, self.capacity))
+            if not values:
+                return
+            block = Block(values)
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next_block = block
+            self.tail = block
+            self.size += len(values)
+
+    def split(self, block):
+        # Move the second half of a full block into a new block after it
+        half = len(block.values) // 2
+        new_block = Block(block.values[half:], block.next_block)
+        del block.values[half:]
+        block.next_block = new_block
+        if self.tail is block:
+            self.tail = new_block
+
+    def deleteAtIndex(self, index):
+        if index < 0 or index >= self.size:
+            return print("Invalid Index!")
+        previous = None
+        block = self.head
+        while index >= len(block.values):
+            index -= len(block.values)
+            previous = block
+            block = block.next_block
+        del block.values[index]
+        self.size -= 1
+        if not block.values:
+            self.unlink(block, previous)
+        elif len(block.values) < self.capacity // 2:
+            self.merge(block)
+
+    def merge(self, block):
+        # Keep blocks at least half full: take the next block's values if they fit, otherwise borrow some
+        following = block.next_block
+        if following is None:
+            return
+        if len(block.values) + len(following.values) <= self.capacity:
+            block.values.extend(following.values)
+            self.unlink(following, block)
+        else:
+            borrow = (len(following.values) - len(block.values)) // 2
+            block.values.extend(following.values[:borrow])
+            del following.values[:borrow]
+
+    def unlink(self, block, previous):
+        if previous is None:
+            self.head = block.next_block
+        else:
+            previous.next_block = block.next_block
+        if self.tail is block:
+            self.tail = previous
@@ -5,6 +5,14 @@ Fibonacci Sequence
 
 '''
 
+from functools import lru_cache
+from math import lcm
+try:
+    # GMP multiplication makes nth_fibonacci much faster for huge n; plain ints are used without it
+    from gmpy2 import mpz
+except ImportError:
+    mpz = int
+
 def fibonacci(n):
     '''
     Generates the Fibonacci Sequence with a size of n
@@ -17,6 +25,161 @@ def fibonacci(n):
         yield first_num
         first_num, second_num = second_num, first_num + second_num
 
+def fibonacci_pair(n):
+    '''
+    Calculates F(n) and F(n+1) by fast doubling, in O(log n) multiplications:
+        F(2k) = F(k) * (2*F(k+1) - F(k))
+        F(2k+1) = F(k)**2 + F(k+1)**2
+
+    INPUT: n(int): the index of the Fibonacci number, n >= 0
+
+    OUTPUT: (tuple): (F(n), F(n+1))
+    '''
+    if n < 0:
+        raise ValueError("n must not be negative")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == "1":
+            a, b = b, a + b
+    return a, b
+
+def nth_fibonacci(n):
+    '''
+    Calculates the nth Fibonacci number, F(0) = 0, F(1) = 1.
+
+    Doubles F(k) together with the Lucas number L(k), which needs only two multiplications per bit:
+        F(2k) = F(k) * L(k)
+        L(2k) = L(k)**2 - 2*(-1)**k
+    and the last step only computes F(n).
+
+    INPUT: n(int): the index of the Fibonacci number, n >= 0
+
+    OUTPUT: (int): F(n)
+    '''
+    if n < 0:
+        raise ValueError("n must not be negative")
+    if n < 2:
+        return n
+    # Start from F(1) = L(1) = 1 and read the remaining bits of n from the most significant
+    f, l = mpz(1), mpz(1)
+    k = 1
+    bits = bin(n)[3:]
+    for i, bit in enumerate(bits):
+        sign = -1 if k % 2 else 1
+        if i == len(bits) - 1:
+            if bit == "0":
+                return int(f * l)
+            # F(2k+1) = (F(2k) + L(2k)) / 2
+            return int((f * l + l * l - 2 * sign) // 2)
+        f, l = f * l, l * l - 2 * sign
+        k *= 2
+        if bit == "1":
+            # F(k+1) = (F(k) + L(k)) / 2 and L(k+1) = (5*F(k) + L(k)) / 2
+            f, l = (f + l) // 2, (5 * f + l) // 2
+            k += 1
+    return int(f)
+
+def fibonacci_pair_mod(n, m):
+    '''
+    Calculates F(n) mod m and F(n+1) mod m by fast doubling
+    '''
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a) % m, (a * a + b * b) % m
+        if bit == "1":
+            a, b = b, (a + b) % m
+    return a, b
+
+def is_period(d, m):
+    return fibonacci_pair_mod(d, m) == (0, 1 % m)
+
+def reduce_period(period, m, factors):
+    '''
+    Finds the smallest period of the Fibonacci numbers mod m that divides a known period
+
+    INPUT:
+        period(int): a known period of the Fibonacci numbers mod m
+        m(int): the modulus
+        factors(lst): the prime factors of period, with repeats
+    '''
+    for q in set(factors):
+        while period % q == 0 and is_period(period // q, m):
+            period //= q
+    return period
+
+@lru_cache(maxsize = None)
+def pisano_period(m):
+    '''
+    Calculates the Pisano period of m, the period of the Fibonacci numbers mod m
+
+    For each prime power p**e of m, the period divides p**(e-1) * P, where P is 3 for p = 2, 20 for p = 5,
+    p - 1 if p mod 5 is 1 or 4, and 2 * (p + 1) otherwise. That bound is reduced to the smallest period,
+    and the period of m is the least common multiple of the periods of its prime powers.
+
+    INPUT: m(int): the modulus, m >= 1
+
+    OUTPUT: (int): the Pisano period of m
+    '''
+    from prime_factors import factorize
+
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m == 1:
+        return 1
+    prime_powers = {}
+    for p in factorize(m):
+        prime_powers[p] = prime_powers.get(p, 0) + 1
+    period = 1
+    for p, e in prime_powers.items():
+        if p == 2:
+            bound = 3
+        elif p == 5:
+            bound = 20
+        elif p % 5 in (1, 4):
+            bound = p - 1
+        else:
+            bound = 2 * (p + 1)
+        factors = factorize(bound) + [p] * (e - 1)
+        period = lcm(period, reduce_period(bound * p**(e - 1), p**e, factors))
+    return period
+
+def fibonacci_mod(n, m):
+    '''
+    Calculates F(n) mod m.
+    When n is larger than the Pisano period of m, n is first reduced modulo the period
+
+    INPUT:
+        n(int): the index of the Fibonacci number, n >= 0
+        m(int): the modulus, m >= 1
+
+    OUTPUT: (int): F(n) mod m
+    '''
+    if n < 0:
+        raise ValueError("n must not be negative")
+    if m < 1:
+        raise ValueError("m must be positive")
+    # The Pisano period is at most 6m, so it can only help if n is larger than that
+    if n > 6 * m:
+        n %= pisano_period(m)
+    return fibonacci_pair_mod(n, m)[0]
+
+def fibonacci_range(a, b):
+    '''
+    Generates the Fibonacci numbers F(a), F(a+1), ..., F(b-1),
+    seeded with F(a) and F(a+1) from fast doubling instead of starting from F(0)
+
+    INPUT:
+        a(int): index of the first Fibonacci number
+        b(int): index after the last Fibonacci number
+    '''
+    if a >= b:
+        return
+    first_num, second_num = fibonacci_pair(a)
+    for _ in range(b - a):
+        yield first_num
+        first_num, second_num = second_num, first_num + second_num
+
 def main():
     '''
     Asks user to enter the size of the Fibonacci Sequence they want
@@ -1,29 +1,96 @@
 '''
 Next Prime Number
     A program that finds prime numbers until the user chooses to stop asking for the next one. 
+
+    next_prime, prev_prime and primes_from keep no state between calls, so any number of callers can use them.
+    Candidates are stepped along a mod 30 wheel, which skips every multiple of 2, 3 and 5,
+    and tested with the deterministic Miller-Rabin test in primality.
 '''
-from math import floor
-current_prime = 3
+from math import isqrt
+from prime_sieve import sieve_segment, small_primes
+from primality import is_prime
 
-def get_next_prime(previous_prime):
-    possible_prime = previous_prime + 2
+# Numbers below 30 that share no factor with 30 = 2 * 3 * 5
+WHEEL = (1, 7, 11, 13, 17, 19, 23, 29)
+# WHEEL_NEXT[r] is the distance from residue r (mod 30) to the next residue on the wheel greater than r
+WHEEL_NEXT = [min(w for w in WHEEL + (31,) if w > r) - r for r in range(30)]
+# WHEEL_PREV[r] is the distance from residue r (mod 30) to the previous residue on the wheel less than r
+WHEEL_PREV = [r - max(w for w in (-1,) + WHEEL if w < r) for r in range(30)]
+SMALL = (2, 3, 5, 7)
+# Window of numbers sieved at once by primes_from, and the largest base prime used to sieve it
+WINDOW = 1 << 16
+SIEVE_PRIME_LIMIT = 1 << 16
+
+def next_prime(n):
+    '''
+    Finds the smallest prime number greater than n
+
+    INPUT: n(int)
+
+    OUTPUT: (int): the next prime after n
+    '''
+    if n < 7:
+        return next(p for p in SMALL if p > n)
+    candidate = n + WHEEL_NEXT[n % 30]
+    while not is_prime(candidate):
+        candidate += WHEEL_NEXT[candidate % 30]
+    return candidate
+
+def prev_prime(n):
+    '''
+    Finds the largest prime number less than n
+
+    INPUT: n(int)
+
+    OUTPUT: (int): the previous prime before n, or None if n <= 2
+    '''
+    if n <= 8:
+        smaller = [p for p in SMALL if p < n]
+        return smaller[-1] if smaller else None
+    candidate = n - WHEEL_PREV[n % 30]
+    while not is_prime(candidate):
+        candidate -= WHEEL_PREV[candidate % 30]
+    return candidate
+
+def primes_from(n):
+    '''
+    Generates the prime numbers greater than or equal to n, in increasing order, without end.
+
+    Works through windows of WINDOW numbers: each window is sieved by the base primes up to
+    SIEVE_PRIME_LIMIT, and only the survivors that could still be composite are given to Miller-Rabin.
+
+    INPUT: n(int): the smallest number to consider
+    '''
+    for p in SMALL:
+        if p >= n:
+            yield p
+    start = max(n, 8) | 1
     while True:
-        isPrime = True
-        for num in range(3, 3, 2):
-            print("hi")
-        
-        for num in range(3, floor(possible_prime / 2), 2):
-            if possible_prime % num == 0:
-                isPrime = False
-                possible_prime += 2
-                break
-        if isPrime:
-            break
-    return possible_prime
+        size = WINDOW // 2
+        end = start + 2 * size
+        root = isqrt(end - 1)
+        base_primes = small_primes(min(root, SIEVE_PRIME_LIMIT))
+        segment = sieve_segment(start, size, base_primes)
+        if root <= SIEVE_PRIME_LIMIT:
+            # Sieved by every prime up to the square root, so every survivor is prime
+            for i in range(size):
+                if segment[i]:
+                    yield start + 2 * i
+        else:
+            for i in range(size):
+                if segment[i] and is_prime(start + 2 * i):
+                    yield start + 2 * i
+        start = end
+
+def get_next_prime(previous_prime):
+    '''
+    Finds the next prime number after previous_prime
+    '''
+    return next_prime(previous_prime)
 
 
 def main():
-    global current_prime
+    current_prime = 3
     print("Let's look at some prime numbers!")
     print("The first prime number is 2.")
     while True:
@@ -39,4 +106,4 @@ def main():
             continue
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,69 @@
+'''
+
+Primality Testing
+    Miller-Rabin primality test using fixed witness bases, which is deterministic (never wrong)
+    for every n below 3.3 * 10**24, and so for all 64-bit integers.
+
+'''
+from math import gcd, prod
+from prime_sieve import small_primes
+
+SMALL_PRIMES = small_primes(100)
+# One gcd with the product of all primes below 100 replaces 25 trial divisions
+PRIMORIAL = prod(SMALL_PRIMES)
+# These 7 witnesses are exact for every n < 2**64
+WITNESSES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+# Testing with the first 13 primes as witnesses is exact for n < 3,317,044,064,679,887,385,961,981
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+DETERMINISTIC_LIMIT = 3317044064679887385961981
+# Extra witnesses for larger n, where the test becomes probabilistic (error below 4**-len(witnesses))
+EXTRA_WITNESSES = (43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+def is_strong_probable_prime(n, a, d, s):
+    '''
+
+    Checks if n passes the Miller-Rabin test for witness a, where n - 1 = d * 2**s with d odd
+
+    '''
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def is_prime(n):
+    '''
+
+    Checks if n is a prime number.
+    Exact for n < 3.3 * 10**24; above that a composite slips through with probability below 2**-100
+
+    INPUT: n(int): the number to test
+
+    OUTPUT: (bool): True if n is prime
+
+    '''
+    if n < 2:
+        return False
+    if n <= SMALL_PRIMES[-1]:
+        return n in SMALL_PRIMES
+    if gcd(n, PRIMORIAL) != 1:
+        return False
+    if n < 10000:
+        # No prime factor below 100, which is the square root of 10000
+        return True
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    if n < 2**64:
+        witnesses = WITNESSES_64
+    elif n < DETERMINISTIC_LIMIT:
+        witnesses = WITNESSES
+    else:
+        witnesses = WITNESSES + EXTRA_WITNESSES
+    # A witness that is a multiple of n says nothing, so it is skipped
+    return all(is_strong_probable_prime(n, a, d, s) for a in witnesses if a % n)
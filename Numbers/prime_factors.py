@@ -4,52 +4,112 @@ Prime Factorization
     Have the user enter a number and find all Prime Factors (if there are any) and display them.
 
 '''
-from math import floor
+from math import gcd
+from random import randrange
+from prime_sieve import primes_in_range, small_primes
+from primality import is_prime
+
+# Factors below this are found by trial division before Pollard's rho is tried
+TRIAL_DIVISION_LIMIT = 1000
 
 def generate_primes(n):
     '''
 
-    Generates a prime number sequence that is less than the given integer
+    Generates a prime number sequence that is less than the given integer,
+    using a segmented Sieve of Eratosthenes
     
     INPUT: n(int): the upper limit of the prime number sequence
 
     '''
-    for num in range(2, n):
-        is_prime = True
-        # immediately yield 2 as prime
-        if num == 2:
-            yield num
+    return primes_in_range(2, n)
+
+def pollard_brent(n):
+    '''
+
+    Finds a non-trivial factor of an odd composite number using Brent's variant of Pollard's rho algorithm
+
+    INPUT: n(int): an odd composite number
+
+    OUTPUT: factor(int): a factor of n, 1 < factor < n
+
+    '''
+    while True:
+        # Iterate x -> x*x + c (mod n) from a random start; retry with new values if the cycle closes without a factor
+        y = randrange(1, n)
+        c = randrange(1, n)
+        batch = 128
+        factor = 1
+        power = 1
+        product = 1
+        while factor == 1:
+            x = y
+            for _ in range(power):
+                y = (y * y + c) % n
+            steps = 0
+            while steps < power and factor == 1:
+                saved_y = y
+                # Multiply a batch of differences together so only one gcd is needed per batch
+                for _ in range(min(batch, power - steps)):
+                    y = (y * y + c) % n
+                    product = product * abs(x - y) % n
+                factor = gcd(product, n)
+                steps += batch
+            power *= 2
+        if factor == n:
+            # The batch overshot; step through it one difference at a time
+            factor = 1
+            while factor == 1:
+                saved_y = (saved_y * saved_y + c) % n
+                factor = gcd(abs(x - saved_y), n)
+        if factor != n:
+            return factor
+
+def factorize(number):
+    '''
+
+    Finds all prime factors of number, with repeats, in increasing order.
+    Uses trial division by small primes, then Miller-Rabin and Pollard's rho for what is left,
+    so it stays in exact integer arithmetic and handles numbers far beyond 64 bits
+
+    INPUT: number(int): number to factor
+
+    OUTPUT: factors(lst): prime factors whose product is number (empty for numbers below 2)
+
+    '''
+    factors = []
+    if number < 2:
+        return factors
+    for prime_number in small_primes(TRIAL_DIVISION_LIMIT):
+        if prime_number * prime_number > number:
+            break
+        while number % prime_number == 0:
+            number //= prime_number
+            factors.append(prime_number)
+    remaining = [number] if number > 1 else []
+    while remaining:
+        n = remaining.pop()
+        if n < TRIAL_DIVISION_LIMIT * TRIAL_DIVISION_LIMIT or is_prime(n):
+            # Without factors below the limit, anything below its square is prime
+            factors.append(n)
             continue
-        # check if num is an even number, which is definitely not prime
-        elif num != 2 and num % 2 == 0:
-            is_prime = False
-        else:
-            # Check if num is divisible by all odd numbers less than its square root to find out if it's a prime number
-            for i in range(3, floor(num / 2), 2):
-                if num % i == 0:
-                    is_prime = False
-                    break
-        if is_prime:
-            yield num
+        factor = pollard_brent(n)
+        remaining.append(factor)
+        remaining.append(n // factor)
+    factors.sort()
+    return factors
 
 def find_prime_factors(number):
     '''
 
-    Generates a prime factor sequence for the given integer
+    Generates a prime factor sequence for the given integer.
+    A prime number has no prime factors other than itself, so nothing is generated for it
 
     INPUT: number(int): number for findind prime factors 
 
     '''
-    for prime_number in generate_primes(number):
-        print(prime_number)
-        # Find prime numbers that are factors of given number
-        while number % prime_number == 0:
-            # Continue dividing number by current prime number until no longer divisible
-            number = number / prime_number
-            yield prime_number
-        # If the number is equal to 1, then we have found all of the prime factors
-        if number == 1:
-            break
+    factors = factorize(number)
+    if len(factors) > 1:
+        yield from factors
 
 def main():
     '''
@@ -0,0 +1,138 @@
+'''
+
+Segmented Sieve of Eratosthenes
+    Lazily generates the prime numbers in any range [lo, hi) one cache-sized segment at a time.
+
+    Each segment only stores the odd numbers (one byte each), so a segment of SEGMENT_SIZE bytes covers
+    2 * SEGMENT_SIZE numbers and stays in cache. Multiples of each base prime are crossed out with a
+    single strided slice assignment, and the primes left are read out with itertools.compress,
+    so the inner loops run in C.
+
+    The base primes (up to the square root of the range) come from a cached prefix of small primes
+    that grows as needed and is shared by every call.
+
+'''
+from itertools import compress
+from math import isqrt
+
+SEGMENT_SIZE = 1 << 19
+ZEROS = memoryview(bytes(SEGMENT_SIZE))
+
+cached_limit = 10
+cached_primes = [2, 3, 5, 7]
+
+def small_primes(limit):
+    '''
+
+    Returns the cached list of all primes less than or equal to limit, extending the cache if needed
+
+    INPUT: limit(int): the largest number to include
+
+    OUTPUT: (lst): list of primes <= limit
+
+    '''
+    global cached_limit, cached_primes
+    if limit > cached_limit:
+        # Grow at least geometrically so repeated small extensions stay cheap
+        new_limit = max(limit, 2 * cached_limit)
+        sieve = bytearray([1]) * (new_limit + 1)
+        sieve[0:2] = b"\x00\x00"
+        for p in range(2, isqrt(new_limit) + 1):
+            if sieve[p]:
+                sieve[p*p::p] = bytes(len(range(p*p, new_limit + 1, p)))
+        cached_primes = list(compress(range(new_limit + 1), sieve))
+        cached_limit = new_limit
+    if limit >= cached_primes[-1]:
+        return cached_primes
+    # Binary search for the number of primes <= limit
+    lo, hi = 0, len(cached_primes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if cached_primes[mid] <= limit:
+            lo = mid + 1
+        else:
+            hi = mid
+    return cached_primes[:lo]
+
+def sieve_segment(start, size, base_primes):
+    '''
+
+    Sieves one segment of odd numbers start, start + 2, ..., start + 2 * (size - 1)
+
+    INPUT:
+        start(int): the first (odd) number of the segment
+        size(int): the number of odd numbers in the segment
+        base_primes(lst): all primes up to the square root of the end of the segment
+
+    OUTPUT: segment(bytearray): segment[i] is 1 if start + 2 * i is prime
+
+    '''
+    segment = bytearray([1]) * size
+    end = start + 2 * size
+    for p in base_primes:
+        if p == 2:
+            continue
+        if p * p >= end:
+            break
+        # First odd multiple of p in the segment, but never p itself
+        multiple = max(p * p, (start + p - 1) // p * p)
+        if multiple % 2 == 0:
+            multiple += p
+        index = (multiple - start) // 2
+        if index < size:
+            segment[index::p] = ZEROS[:len(range(index, size, p))]
+    if start == 1:
+        segment[0] = 0
+    return segment
+
+def primes_in_range(lo, hi = None, segment_size = SEGMENT_SIZE):
+    '''
+
+    Generates the prime numbers in the range [lo, hi), in increasing order
+
+    INPUT:
+        lo(int): the smallest number to consider
+        hi(int): the upper limit (not included), None for an endless stream of primes
+        segment_size(int): number of odd numbers sieved at a time
+
+    '''
+    lo = max(lo, 2)
+    if hi is not None and hi <= lo:
+        return
+    if lo == 2:
+        yield 2
+    start = lo | 1
+    while hi is None or start < hi:
+        size = segment_size
+        if hi is not None:
+            size = min(size, (hi - start + 1) // 2)
+        end = start + 2 * size
+        base_primes = small_primes(isqrt(end - 1))
+        segment = sieve_segment(start, size, base_primes)
+        yield from compress(range(start, end, 2), segment)
+        start = end
+
+def count_primes_in_range(lo, hi, segment_size = SEGMENT_SIZE):
+    '''
+
+    Counts the prime numbers in the range [lo, hi) without generating them one by one
+
+    INPUT:
+        lo(int): the smallest number to consider
+        hi(int): the upper limit (not included)
+        segment_size(int): number of odd numbers sieved at a time
+
+    OUTPUT: count(int): the number of primes in [lo, hi)
+
+    '''
+    lo = max(lo, 2)
+    if hi <= lo:
+        return 0
+    count = 1 if lo == 2 else 0
+    start = lo | 1
+    while start < hi:
+        size = min(segment_size, (hi - start + 1) // 2)
+        end = start + 2 * size
+        count += sieve_segment(start, size, small_primes(isqrt(end - 1))).count(1)
+        start = end
+    return count
@@ -0,0 +1,126 @@
+'''
+
+Smallest Prime Factor Table
+    For factoring many integers below a fixed bound: build a table of the smallest prime factor of
+    every number up to N once, then factor each number in O(log n) by repeatedly dividing by its
+    smallest prime factor.
+
+    The table is an array('I') (4 bytes per number). It can be saved to disk and memory-mapped on
+    later runs, so it is neither rebuilt nor read into memory up front.
+
+'''
+import mmap
+import os
+from array import array
+from math import isqrt
+from prime_factors import factorize
+from prime_sieve import small_primes
+
+# Largest table bulk_factorize builds on its own (40 MB); larger numbers fall back to factorize
+LIMIT = 10**7
+# array("I") holds unsigned 32-bit integers
+MAX_TABLE = 2**32 - 1
+
+def build_spf_table(n):
+    '''
+
+    Builds the smallest prime factor table for all numbers up to n
+
+    INPUT: n(int): the largest number in the table
+
+    OUTPUT: table(array): table[i] is the smallest prime factor of i (table[i] == i for primes, and for 0 and 1)
+
+    '''
+    if n > MAX_TABLE:
+        raise ValueError("The table can only cover numbers up to {}".format(MAX_TABLE))
+    table = array("I", range(n + 1))
+    # Going from the largest base prime down, each smaller prime overwrites the larger ones,
+    # so every composite ends up with its smallest prime factor (every composite m with
+    # smallest prime factor p is at least p*p, so p's slice reaches it)
+    for p in reversed(small_primes(isqrt(n))):
+        table[p*p::p] = array("I", [p]) * len(range(p*p, n + 1, p))
+    return table
+
+def save_spf_table(table, path):
+    '''
+
+    Writes the table to path as raw native-endian 32-bit integers
+
+    '''
+    with open(path, "wb") as f:
+        table.tofile(f)
+
+def load_spf_table(path):
+    '''
+
+    Memory-maps a table written by save_spf_table
+
+    INPUT: path(str): path of the saved table
+
+    OUTPUT: table(memoryview): read-only view of the table, indexed like the array
+
+    '''
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+    return memoryview(mapped).cast("I")
+
+def spf_table(n, path = None):
+    '''
+
+    Returns a smallest prime factor table covering at least n.
+    If path is given, a saved table that is large enough is memory-mapped instead of rebuilt,
+    otherwise a new table is built and saved there
+
+    INPUT:
+        n(int): the largest number the table has to cover
+        path(str): optional file to load the table from or save it to
+
+    '''
+    if path is not None and os.path.exists(path) and os.path.getsize(path) // 4 > n:
+        return load_spf_table(path)
+    table = build_spf_table(n)
+    if path is not None:
+        save_spf_table(table, path)
+    return table
+
+def factorize_with_table(number, table):
+    '''
+
+    Finds all prime factors of number, with repeats, in increasing order, using the table.
+    Numbers beyond the table fall back to prime_factors.factorize
+
+    INPUT:
+        number(int): number to factor
+        table(array): smallest prime factor table
+
+    OUTPUT: factors(lst): prime factors whose product is number (empty for numbers below 2)
+
+    '''
+    if number >= len(table):
+        return factorize(number)
+    factors = []
+    while number > 1:
+        p = table[number]
+        factors.append(p)
+        number //= p
+    return factors
+
+def bulk_factorize(numbers, table = None, limit = LIMIT):
+    '''
+
+    Factors every number of an iterable with one smallest prime factor table
+
+    INPUT:
+        numbers(iterable): numbers to factor
+        table(array): smallest prime factor table, built to cover the largest number up to limit if not given
+        limit(int): largest table to build; numbers beyond the table are factored with prime_factors.factorize
+
+    OUTPUT: (lst): list of prime factor lists, in the same order as numbers
+
+    '''
+    if table is None:
+        numbers = list(numbers)
+        # Only numbers the table will cover decide its size
+        limit = min(limit, MAX_TABLE)
+        table = build_spf_table(max((number for number in numbers if number <= limit), default = 1))
+    return [factorize_with_table(number, table) for number in numbers]
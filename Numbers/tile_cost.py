@@ -3,8 +3,27 @@
 Find Cost of Tile to Cover W x H Floor
     Calculate the total cost of tile it would take to cover a floor plan of width and height, using a cost entered by the user.
 
+    Whole catalogs can be priced in batch from a CSV file with width, length and price columns:
+        python tile_cost.py --csv floors.csv --output quotes.csv --workers 4
+    Rows are streamed in chunks, priced with exact Decimal arithmetic and written as soon as they are done,
+    so memory stays bounded however many rows there are.
+
 '''
+import argparse
+import csv
 import decimal
+import os
+import shutil
+import sys
+from itertools import chain, islice
+
+CENTS = decimal.Decimal(".01")
+FIELDS = ["width", "length", "price"]
+CHUNK_SIZE = 10000
+# Totals with more digits before the decimal point than this are rejected as too large
+MAX_DIGITS = 100
+# Exact for any sum of up to 10**20 totals
+TOTALS_CONTEXT = decimal.Context(prec = MAX_DIGITS + 22, traps = [decimal.Inexact, decimal.InvalidOperation])
 
 def calc_cost(list_of_variables):
     result = 1
@@ -12,21 +31,272 @@ def calc_cost(list_of_variables):
         result *= value
     return result
 
+def parse_positive(text):
+    '''
+
+    Converts text to an exact positive Decimal
+
+    INPUT: text(str): the number to convert
+
+    OUTPUT: (Decimal): the number, raises ValueError if it is not a positive number
+
+    '''
+    try:
+        value = decimal.Decimal(text.strip())
+    except (decimal.InvalidOperation, AttributeError):
+        raise ValueError("Numbers only!")
+    if not value.is_finite() or value <= 0:
+        raise ValueError("Positive numbers only!")
+    return value
+
+def price_floor(width, length, price):
+    '''
+
+    Calculates the cost of tiling a floor, rounded to the cent
+
+    INPUT:
+        width(str or Decimal): width of the floor
+        length(str or Decimal): length of the floor
+        price(str or Decimal): cost per square meter
+
+    OUTPUT: (Decimal): exact total cost, rounded half to even to two decimal places,
+        raises ValueError if an input is invalid or the total has more than MAX_DIGITS digits before the decimal point
+
+    '''
+    variables = [parse_positive(str(width)), parse_positive(str(length)), parse_positive(str(price))]
+    with decimal.localcontext() as context:
+        # Enough precision and exponent range for the exact product, so it is only rounded once, to the cent
+        context.prec = sum(len(value.as_tuple().digits) for value in variables)
+        context.Emax = decimal.MAX_EMAX
+        context.Emin = decimal.MIN_EMIN
+        context.traps[decimal.Inexact] = True
+        total = calc_cost(variables)
+        if total.adjusted() >= MAX_DIGITS:
+            raise ValueError("Number too large!")
+        context.traps[decimal.Inexact] = False
+        context.prec = max(total.adjusted() + 3, 1)
+        return total.quantize(CENTS)
+
+def price_rows(rows, columns):
+    '''
+
+    Prices a chunk of CSV rows
+
+    INPUT:
+        rows(lst): list of rows, each a list of strings
+        columns(lst): indices of the width, length and price columns
+
+    OUTPUT: (lst): the rows with the total (or "" if invalid) and an error message (or "") appended
+
+    '''
+    priced = []
+    for row in rows:
+        try:
+            total = str(price_floor(*(row[i] for i in columns)))
+            error = ""
+        except ValueError as e:
+            total = ""
+            error = str(e)
+        except IndexError:
+            total = ""
+            error = "Missing field!"
+        priced.append(row + [total, error])
+    return priced
+
+def chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def read_header(reader):
+    '''
+
+    Finds the width, length and price columns from the first row of a CSV file.
+    If the first row names them they are used (other columns are kept),
+    otherwise it is a data row and the first three columns are width, length and price
+
+    OUTPUT: (tuple): (column indices, header row or None, rows to price before the rest of the reader)
+
+    '''
+    first = next(reader, None)
+    if first is None:
+        return [0, 1, 2], None, []
+    names = [name.strip().lower() for name in first]
+    if all(field in names for field in FIELDS):
+        return [names.index(field) for field in FIELDS], first, []
+    return [0, 1, 2], None, [first]
+
+def price_stream(rows, writer, columns, chunk_size = CHUNK_SIZE):
+    '''
+
+    Prices rows chunk by chunk and writes each priced chunk as soon as it is done
+
+    OUTPUT: (tuple): (number of rows priced, number of invalid rows, sum of all totals)
+
+    '''
+    n_rows = 0
+    n_invalid = 0
+    grand_total = decimal.Decimal(0)
+    for chunk in chunks(rows, chunk_size):
+        priced = price_rows(chunk, columns)
+        for row in priced:
+            n_rows += 1
+            if row[-2]:
+                grand_total = TOTALS_CONTEXT.add(grand_total, decimal.Decimal(row[-2]))
+            else:
+                n_invalid += 1
+        writer.writerows(priced)
+    return n_rows, n_invalid, grand_total
+
+def price_csv(input_file, output_file, chunk_size = CHUNK_SIZE):
+    '''
+
+    Prices every floor plan in a CSV file and writes each row with its total and an error message
+    (empty unless the row is invalid) to another CSV file, streaming chunk_size rows at a time
+
+    INPUT:
+        input_file(file): open CSV file to read
+        output_file(file): open file to write the priced CSV to
+        chunk_size(int): number of rows held in memory at once
+
+    OUTPUT: (tuple): (number of rows priced, number of invalid rows, sum of all totals)
+
+    '''
+    reader = csv.reader(input_file)
+    writer = csv.writer(output_file)
+    columns, header, rows = read_header(reader)
+    if header is not None:
+        writer.writerow(header + ["total", "error"])
+    n_rows, n_invalid, grand_total = price_stream(chain(rows, reader), writer, columns, chunk_size)
+    return n_rows, n_invalid, grand_total.quantize(CENTS, context = TOTALS_CONTEXT)
+
+def read_lines(f, end):
+    '''
+
+    Reads lines from a binary file until its position reaches end
+
+    '''
+    while f.tell() < end:
+        line = f.readline()
+        if not line:
+            return
+        yield line.decode("utf-8")
+
+def price_shard(input_path, start, end, columns, part_path, chunk_size = CHUNK_SIZE):
+    '''
+
+    Prices the lines of input_path between byte offsets start and end (both at line starts) into part_path
+
+    OUTPUT: (tuple): (number of rows priced, number of invalid rows, sum of all totals)
+
+    '''
+    with open(input_path, "rb") as f, open(part_path, "w", newline = "") as part:
+        f.seek(start)
+        return price_stream(csv.reader(read_lines(f, end)), csv.writer(part), columns, chunk_size)
+
+def shard_offsets(path, data_start, workers):
+    '''
+
+    Splits the bytes of a file after data_start into workers ranges that start and end at line boundaries
+
+    OUTPUT: (lst): list of (start, end) byte offsets
+
+    '''
+    size = os.path.getsize(path)
+    offsets = [data_start]
+    with open(path, "rb") as f:
+        for i in range(1, workers):
+            f.seek(max(data_start + (size - data_start) * i // workers, offsets[-1]))
+            if f.tell() > data_start:
+                # Back up one byte and finish that line, so a range never starts mid-line
+                f.seek(f.tell() - 1)
+                f.readline()
+            offsets.append(f.tell())
+    offsets.append(size)
+    return [(start, end) for start, end in zip(offsets, offsets[1:]) if start < end]
+
+def price_csv_file(input_path, output_path, workers = 1, chunk_size = CHUNK_SIZE):
+    '''
+
+    Prices a CSV file into another CSV file like price_csv.
+    With workers > 1 the file is split into that many byte ranges at line boundaries, each process
+    parses and prices its own range into a temporary part file, and the parts are joined in order.
+    This assumes no quoted field contains a line break.
+
+    INPUT:
+        input_path(str): CSV file to read
+        output_path(str): CSV file to write
+        workers(int): number of processes to price with
+        chunk_size(int): number of rows each process holds in memory at once
+
+    OUTPUT: (tuple): (number of rows priced, number of invalid rows, sum of all totals)
+
+    '''
+    if workers <= 1:
+        with open(input_path, newline = "") as input_file, open(output_path, "w", newline = "") as output_file:
+            return price_csv(input_file, output_file, chunk_size)
+    from multiprocessing import Pool
+    with open(input_path, "rb") as f:
+        first_line = f.readline()
+        after_first = f.tell()
+    columns, header, _ = read_header(csv.reader([first_line.decode("utf-8")]))
+    shards = shard_offsets(input_path, after_first if header is not None else 0, workers)
+    part_paths = ["{}.part{}".format(output_path, i) for i in range(len(shards))]
+    try:
+        with Pool(workers) as pool:
+            results = pool.starmap(price_shard, [(input_path, start, end, columns, part_path, chunk_size) for (start, end), part_path in zip(shards, part_paths)])
+        with open(output_path, "w", newline = "") as output_file:
+            if header is not None:
+                csv.writer(output_file).writerow(header + ["total", "error"])
+            for part_path in part_paths:
+                with open(part_path, newline = "") as part:
+                    shutil.copyfileobj(part, output_file)
+    finally:
+        for part_path in part_paths:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+    n_rows = sum(result[0] for result in results)
+    n_invalid = sum(result[1] for result in results)
+    grand_total = decimal.Decimal(0)
+    for result in results:
+        grand_total = TOTALS_CONTEXT.add(grand_total, result[2])
+    return n_rows, n_invalid, grand_total.quantize(CENTS, context = TOTALS_CONTEXT)
+
 def main():
     outputs = {0: "width of the floor", 1:"length of the floor", 2:"cost per square meter"}
     variables = ["width", "length", "cost"]
     for key in outputs:
-        try: 
-            variables[key] = float(input(f"What is the {outputs[key]}?: "))
-        except:
-            print("Numbers only!")
-            continue
-        else: 
-            if variables[key] <= 0: 
-                print("Positive numbers only!")
+        # Keep asking for the same value until it is a positive number
+        while True:
+            try:
+                variables[key] = parse_positive(input(f"What is the {outputs[key]}?: "))
+            except ValueError as e:
+                print(e)
                 continue
-    return print("The total cost is ${}".format(decimal.Decimal(calc_cost(variables)).quantize(decimal.Decimal(".01"))))
-    
+            else:
+                break
+    try:
+        return print("The total cost is ${}".format(price_floor(*variables)))
+    except ValueError as e:
+        return print(e)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description = "Calculate the cost of tiling floors")
+    parser.add_argument("--csv", help = "price every row of this CSV file (width, length, price) instead of asking")
+    parser.add_argument("--output", help = "file to write the priced CSV to (default: stdout)")
+    parser.add_argument("--workers", type = int, default = 1, help = "number of processes to price with (needs --output)")
+    parser.add_argument("--chunk-size", type = int, default = CHUNK_SIZE, help = "rows held in memory at once")
+    args = parser.parse_args()
+    if args.csv is None:
+        main()
+    else:
+        if args.output:
+            n_rows, n_invalid, grand_total = price_csv_file(args.csv, args.output, args.workers, args.chunk_size)
+        else:
+            with open(args.csv, newline = "") as input_file:
+                n_rows, n_invalid, grand_total = price_csv(input_file, sys.stdout, args.chunk_size)
+        print("Priced {} floors ({} invalid), total ${}".format(n_rows, n_invalid, grand_total), file = sys.stderr)